@@ -31,6 +31,12 @@ try:
         from ._dgen_rs import get_numa_info
     except ImportError:
         get_numa_info = None
+    
+    # GIL-free positioned writes (Linux only)
+    try:
+        from ._dgen_rs import write_runs
+    except ImportError:
+        write_runs = None
         
 except ImportError as e:
     raise ImportError(
@@ -51,6 +57,7 @@ __all__ = [
     "create_bytearrays",
     "get_numa_info",
     "get_system_info",
+    "write_runs",
 ]
 
 
@@ -1,6 +1,6 @@
 """Type stubs for dgen-py"""
 
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 def generate_buffer(
     size: int,
@@ -36,6 +36,10 @@ class Generator:
         """Fill next chunk into buffer"""
         ...
     
+    def fill_chunks(self, buffer, max_chunks: Optional[int] = None) -> int:
+        """Fill chunks into the same buffer until complete; returns total bytes"""
+        ...
+    
     def get_chunk(self, chunk_size: int) -> Optional[bytes]:
         """Get next chunk as bytes"""
         ...
@@ -59,3 +63,7 @@ class Generator:
 def get_numa_info() -> dict:
     """Get NUMA topology information"""
     ...
+
+def write_runs(fd: int, runs: Sequence[Sequence[Tuple[object, int, int]]]) -> List[int]:
+    """Write runs of file-contiguous (buffer, nbytes, offset) items with pwritev(), releasing the GIL (Linux only)"""
+    ...
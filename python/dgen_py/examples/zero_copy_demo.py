@@ -23,23 +23,35 @@ def main():
     # =========================================================================
     # Step 1: Generate data (Rust allocation)
     # =========================================================================
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     data = dgen_py.generate_data(size)
-    gen_time = time.perf_counter() - start
-    throughput = size / gen_time / 1e9
+    gen_ns = time.perf_counter_ns() - start
+    throughput = size / gen_ns  # bytes/ns == GB/s
     
-    print(f"✓ Generation: {throughput:.2f} GB/s ({gen_time*1000:.1f} ms)")
+    print(f"✓ Generation: {throughput:.2f} GB/s ({gen_ns / 1e6:.1f} ms)")
     print(f"  Type: {type(data).__name__}")
     print(f"  Size: {len(data):,} bytes")
     
+    # =========================================================================
+    # Step 1b: Fill a reused buffer (ZERO ALLOC - caller owns the memory)
+    # =========================================================================
+    buf = bytearray(size)  # Allocated once, outside the timed region
+    start = time.perf_counter_ns()
+    nbytes = dgen_py.fill_buffer(buf)
+    fill_ns = time.perf_counter_ns() - start
+    fill_throughput = nbytes / fill_ns
+    
+    print(f"\n✓ fill_buffer (reused buffer): {fill_throughput:.2f} GB/s ({fill_ns / 1e6:.1f} ms)")
+    print(f"  No allocation per call: refill the same buffer every time")
+    
     # =========================================================================
     # Step 2: Create memoryview (ZERO COPY - just pointer!)
     # =========================================================================
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     view = memoryview(data)
-    view_time = time.perf_counter() - start
+    view_ns = time.perf_counter_ns() - start
     
-    print(f"\n✓ Memoryview: {view_time * 1e6:.1f} µs (ZERO COPY)")
+    print(f"\n✓ Memoryview: {view_ns / 1e3:.3f} µs (ZERO COPY)")
     print(f"  Readonly: {view.readonly}")
     print(f"  Format: '{view.format}' (unsigned byte)")
     print(f"  Size: {len(view):,} bytes")
@@ -47,11 +59,11 @@ def main():
     # =========================================================================
     # Step 3: Create numpy array (ZERO COPY - same memory!)
     # =========================================================================
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     arr = np.frombuffer(view, dtype=np.uint8)
-    arr_time = time.perf_counter() - start
+    arr_ns = time.perf_counter_ns() - start
     
-    print(f"\n✓ Numpy array: {arr_time * 1e6:.1f} µs (ZERO COPY)")
+    print(f"\n✓ Numpy array: {arr_ns / 1e3:.3f} µs (ZERO COPY)")
     print(f"  Shape: {arr.shape}")
     print(f"  Dtype: {arr.dtype}")
     print(f"  Size: {arr.nbytes:,} bytes")
@@ -63,22 +75,26 @@ def main():
     print("VERIFICATION: All three share the SAME memory location")
     print("=" * 60)
     
-    # Sample first 10 bytes
-    print(f"\nFirst 10 bytes:")
-    print(f"  Memoryview: {bytes(view[:10]).hex()}")
-    print(f"  Numpy: {arr[:10].tobytes().hex()}")
-    print(f"  ✓ Identical!")
+    # Compare data pointers (copying bytes out to compare them would itself be a copy)
+    data_addr = np.frombuffer(data, dtype=np.uint8).__array_interface__['data'][0]
+    arr_addr = arr.__array_interface__['data'][0]
+    same = arr_addr == data_addr
+    print(f"\nData pointers:")
+    print(f"  Generated data: {data_addr:#x}")
+    print(f"  Numpy (via memoryview): {arr_addr:#x}")
+    print(f"  {'✓ Same memory!' if same else '✗ Different memory (data was copied)'}")
     
     # Total time breakdown
-    total_copy_time = view_time + arr_time
+    total_copy_ns = view_ns + arr_ns
     print(f"\n" + "=" * 60)
     print(f"PERFORMANCE SUMMARY")
     print(f"=" * 60)
-    print(f"Generation: {gen_time*1000:6.1f} ms  ({throughput:.2f} GB/s)")
-    print(f"Memoryview: {view_time*1e6:6.1f} µs  (zero-copy)")
-    print(f"Numpy:      {arr_time*1e6:6.1f} µs  (zero-copy)")
+    print(f"Generation: {gen_ns / 1e6:6.1f} ms  ({throughput:.2f} GB/s)")
+    print(f"Fill reused:{fill_ns / 1e6:6.1f} ms  ({fill_throughput:.2f} GB/s, no allocation)")
+    print(f"Memoryview: {view_ns / 1e3:6.3f} µs  (zero-copy)")
+    print(f"Numpy:      {arr_ns / 1e3:6.3f} µs  (zero-copy)")
     print(f"            {'-'*20}")
-    print(f"Total copy: {total_copy_time*1e6:6.1f} µs  (<< 1% overhead)")
+    print(f"Total copy: {total_copy_ns / 1e3:6.3f} µs  (<< 1% overhead)")
     
     # Memory efficiency
     print(f"\n" + "=" * 60)
@@ -31,11 +31,15 @@ Requirements:
 """
 
 import os
+import re
+import errno
 import sys
 import time
 import threading
-import queue
+import collections
+import itertools
 import argparse
+from array import array
 from dataclasses import dataclass
 from typing import Optional
 import platform
@@ -47,6 +51,25 @@ except ImportError:
     print("Run: pip install dgen-py")
     sys.exit(1)
 
+# GIL-free batched pwritev() from the Rust extension (Linux builds only)
+native_write_runs = getattr(dgen_py, 'write_runs', None)
+
+# Optional: io_uring write engine (--io-engine uring). UringWriter needs the
+# Ring / Cqe / Iovec API of the liburing bindings; releases without it are
+# treated as not installed.
+URING_API = (
+    'Ring', 'Cqe', 'Iovec', 'io_uring_queue_init', 'io_uring_queue_exit',
+    'io_uring_get_sqe', 'io_uring_prep_writev', 'io_uring_sqe_set_data64',
+    'io_uring_submit', 'io_uring_wait_cqe', 'io_uring_peek_cqe', 'io_uring_cqe_seen',
+)
+try:
+    import liburing
+except ImportError:
+    liburing = None
+else:
+    if not all(hasattr(liburing, name) for name in URING_API):
+        liburing = None
+
 
 # ===========================================================================
 # Configuration & Stats
@@ -65,6 +88,40 @@ class BenchmarkConfig:
     numa_mode: str
     max_threads: Optional[int]
     num_writers: int = 1
+    num_producers: int = 1
+    io_engine: str = 'sync'  # 'sync' (pwrite/pwritev) or 'uring' (io_uring via liburing)
+    queue_depth: int = 32    # io_uring submission queue depth per writer
+    huge_pages: bool = False # Back buffer pool with explicit 2 MB hugetlb pages
+    writer_affinity: str = 'auto'  # 'auto' (spread over nodes), 'numa' (device node), 'none'
+    alignment: int = 4096    # Buffer alignment: max(device logical block size, page size)
+    sparse: bool = False     # Skip all-zero ranges, leaving holes in the output file
+    dedup_copy: bool = False # Write duplicates with copy_file_range instead of generating them
+
+
+CACHE_LINE_SIZE = 64
+
+
+class ProgressCounters:
+    """
+    Per-thread progress counters, one cache line apart.
+    
+    Values are raw uint64s in one array('Q') rather than Python ints in a
+    list, and slots are spaced a cache line apart so threads on different
+    cores never write to the same line (no false sharing). Each slot has a
+    single writer, its owning thread, which stores into values[slot(i)]
+    directly; readers sum the slots without a lock.
+    """
+    STRIDE = CACHE_LINE_SIZE // 8  # uint64 slots per cache line
+    
+    def __init__(self, count: int):
+        self.values = array('Q', [0]) * (count * self.STRIDE)
+    
+    def slot(self, index: int) -> int:
+        """Array index of thread `index`'s counter"""
+        return index * self.STRIDE
+    
+    def total(self) -> int:
+        return sum(self.values[::self.STRIDE])
 
 
 @dataclass
@@ -76,13 +133,35 @@ class BenchmarkStats:
     bytes_written: int
     producer_wait_time: float = 0.0
     consumer_wait_time: float = 0.0
+    sparse_bytes: int = 0  # Zero ranges left as holes (--sparse), included in bytes_written
+    copied_bytes: int = 0  # Duplicates made with copy_file_range (--dedup-copy), included in bytes_written
     write_count: int = 0
     used_direct_io: bool = False
-    writer_stats: dict = None  # Per-writer statistics
+    num_producers: int = 1
+    # Per-writer statistics, one slot per writer. Each writer fills only its
+    # own slot (no lock); merge_writer_stats() folds them into the totals.
+    writer_stats: list = None
+    # Live progress counters, one slot per thread. Each slot has a single
+    # writer (its owning thread); the reporter thread only reads them.
+    generated_progress: ProgressCounters = None
+    written_progress: ProgressCounters = None
+    
+    def merge_writer_stats(self):
+        """Add the per-writer slots to the totals (call after writers join)"""
+        finished = [w for w in self.writer_stats if w is not None]
+        self.bytes_written += sum(w['bytes'] for w in finished)
+        self.write_count += sum(w['writes'] for w in finished)
+        self.consumer_wait_time += sum(w['wait_time'] for w in finished)
+        self.sparse_bytes += sum(w['sparse_bytes'] for w in finished)
+        self.copied_bytes += sum(w['copied_bytes'] for w in finished)
     
     def __post_init__(self):
         if self.writer_stats is None:
-            self.writer_stats = {}
+            self.writer_stats = []
+        if self.generated_progress is None:
+            self.generated_progress = ProgressCounters(self.num_producers)
+        if self.written_progress is None:
+            self.written_progress = ProgressCounters(0)
     
     @property
     def total_time(self) -> float:
@@ -111,10 +190,14 @@ class BenchmarkStats:
     
     @property
     def producer_utilization(self) -> float:
-        """Producer utilization percentage (lower = more waiting)"""
+        """Producer utilization percentage (lower = more waiting)
+        
+        For multiple producers, this uses the average wait time per producer.
+        """
         if self.total_time <= 0:
             return 0.0
-        return (1.0 - self.producer_wait_time / self.total_time) * 100
+        avg_wait_time = self.producer_wait_time / max(1, self.num_producers)
+        return (1.0 - avg_wait_time / self.total_time) * 100
     
     @property
     def consumer_utilization(self) -> float:
@@ -128,7 +211,7 @@ class BenchmarkStats:
         
         # If we have per-writer stats, calculate average wait time
         if self.writer_stats:
-            num_writers = len(self.writer_stats)
+            num_writers = sum(1 for w in self.writer_stats if w is not None)
             if num_writers > 0:
                 avg_wait_time = self.consumer_wait_time / num_writers
                 return (1.0 - avg_wait_time / self.total_time) * 100
@@ -141,6 +224,16 @@ class BenchmarkStats:
 # Auto-Tuning
 # ===========================================================================
 
+# Upper bound for an auto-tuned buffer pool. Every pool page is faulted in
+# (and pinned in RSS) before the benchmark starts, so scaling the pool purely
+# with CPU count (1024 x 8 MB = 8 GB on large boxes) costs far more in setup
+# time and memory than it buys in pipeline depth.
+MAX_AUTO_POOL_BYTES = 2 * 1024**3  # 2 GB
+
+# Page size used when pre-faulting buffers
+PAGE_SIZE = 4096
+HUGE_PAGE_SIZE = 2 * 1024 * 1024
+
 def auto_tune_settings(buffer_size: int = None, buffer_count: int = None, 
                        num_writers: int = None) -> tuple:
     """
@@ -151,6 +244,9 @@ def auto_tune_settings(buffer_size: int = None, buffer_count: int = None,
     - Medium systems (16-32 CPUs): 8 writers, 256 buffers
     - Large systems (64-128 CPUs): 16-32 writers, 512+ buffers
     
+    The auto-tuned buffer count is capped so the total pool stays within
+    MAX_AUTO_POOL_BYTES (but never below 4 buffers per writer).
+    
     Returns:
         tuple: (buffer_size, buffer_count, num_writers)
     """
@@ -193,6 +289,10 @@ def auto_tune_settings(buffer_size: int = None, buffer_count: int = None,
             buffer_count = max(512, min_buffers)
         else:
             buffer_count = max(1024, min_buffers)
+        
+        # Cap pool size: pre-faulting and RSS grow linearly with the pool
+        max_buffers = max(num_writers * 4, MAX_AUTO_POOL_BYTES // buffer_size)
+        buffer_count = min(buffer_count, max_buffers)
     
     return (buffer_size, buffer_count, num_writers)
 
@@ -201,34 +301,704 @@ def auto_tune_settings(buffer_size: int = None, buffer_count: int = None,
 # Buffer Pool Management
 # ===========================================================================
 
-def create_aligned_buffer_pool(buffer_size: int, buffer_count: int):
+def create_hugetlb_region(total_bytes: int):
+    """
+    Map an explicit 2 MB hugetlb region via memfd_create(MFD_HUGETLB).
+    
+    Hugetlb pages come from the kernel's reserved pool (vm.nr_hugepages), so
+    the mapping fails up front if the reservation is too small rather than
+    faulting later.
+    
+    Args:
+        total_bytes: Region size (must be a multiple of HUGE_PAGE_SIZE)
+        
+    Returns:
+        mmap object, or None if hugetlb pages are unavailable
     """
-    Create a pool of page-aligned buffers using mmap.
+    import mmap
     
-    Page alignment is required for O_DIRECT on Linux.
-    Using mmap ensures proper alignment without needing ctypes/cffi.
+    if not hasattr(os, 'memfd_create') or not hasattr(os, 'MFD_HUGETLB'):
+        print(f"Warning: memfd_create(MFD_HUGETLB) not available on this platform")
+        return None
+    
+    flags = os.MFD_HUGETLB | getattr(os, 'MFD_HUGE_2MB', 0)
+    try:
+        fd = os.memfd_create("dgen_pool", flags)
+    except OSError as e:
+        print(f"Warning: memfd_create(MFD_HUGETLB) failed: {e}")
+        return None
+    
+    try:
+        os.ftruncate(fd, total_bytes)
+        return mmap.mmap(fd, total_bytes, flags=mmap.MAP_SHARED,
+                         prot=mmap.PROT_READ | mmap.PROT_WRITE)
+    except OSError as e:
+        print(f"Warning: hugetlb mapping of {total_bytes / (1024**2):.0f} MB failed: {e}")
+        print(f"         (check vm.nr_hugepages in /proc/meminfo)")
+        return None
+    finally:
+        os.close(fd)  # The mapping keeps the memory alive
+
+
+def create_aligned_buffer_pool(buffer_size: int, buffer_count: int, huge_pages: bool = False,
+                               alignment: int = PAGE_SIZE):
+    """
+    Create a pool of page-aligned buffers carved from one mmap region.
+    
+    O_DIRECT on Linux requires buffers aligned to the device's logical block
+    size. A single anonymous mapping is page-aligned by construction, and
+    each buffer starts on an `alignment` boundary (the per-buffer stride is
+    rounded up to it), so every buffer handed out is valid for O_DIRECT
+    without ctypes/cffi. Alignments above the page size (e.g. 8 KB LBAs)
+    are met by offsetting into a slightly larger region.
+    One region also means one VMA and one madvise() call instead of one
+    per buffer.
+    
+    With huge_pages=True the region is backed by explicit 2 MB hugetlb pages
+    (size rounded up to 2 MB), falling back to transparent huge pages if no
+    hugetlb reservation is available.
+    
+    Anonymous mappings are demand-faulted on first write, so the region is
+    advised for transparent huge pages (where supported) and then pre-faulted
+    by touching every page. This keeps page-fault cost out of the first pass
+    of fill_chunk() and out of the early producer wait-time measurements.
     
     Args:
         buffer_size: Size of each buffer in bytes
         buffer_count: Number of buffers to allocate
+        huge_pages: Back the pool with explicit hugetlb pages
+        alignment: Buffer address alignment (multiple of PAGE_SIZE)
         
     Returns:
-        list of mmap objects (writable, page-aligned buffers)
+        list of memoryview slices (writable, page-aligned buffers)
     """
     import mmap
     
-    pool = []
-    for _ in range(buffer_count):
-        # Create anonymous memory-mapped region (RAM-backed, page-aligned)
+    stride = (buffer_size + alignment - 1) // alignment * alignment
+    total_bytes = stride * buffer_count
+    if alignment > PAGE_SIZE:
+        total_bytes += alignment - PAGE_SIZE  # Room to align the first buffer
+    
+    region = None
+    if huge_pages:
+        hugetlb_bytes = (total_bytes + HUGE_PAGE_SIZE - 1) // HUGE_PAGE_SIZE * HUGE_PAGE_SIZE
+        region = create_hugetlb_region(hugetlb_bytes)
+        if region is not None:
+            print(f"  Buffer pool backed by {hugetlb_bytes // HUGE_PAGE_SIZE} x 2 MB hugetlb pages")
+        else:
+            print(f"  Falling back to transparent huge pages")
+    
+    try:
+        if region is None:
+            # Anonymous memory-mapped region (RAM-backed, page-aligned)
+            region = mmap.mmap(-1, total_bytes,
+                               flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS,
+                               prot=mmap.PROT_READ | mmap.PROT_WRITE)
+    except Exception as e:
+        print(f"Warning: Failed to create buffer pool via mmap: {e}")
+        # Fallback to bytearray (not guaranteed to be aligned)
+        region = bytearray(total_bytes)
+    else:
+        # Prefer 2 MB transparent huge pages (fewer TLB entries per pool sweep)
+        if hasattr(mmap, 'MADV_HUGEPAGE'):
+            try:
+                region.madvise(mmap.MADV_HUGEPAGE)
+            except OSError:
+                pass  # THP disabled or unsupported - 4 KB pages still work
+        
+        # Pre-fault: touch every page so generation never pays first-touch cost
+        for offset in range(0, total_bytes, PAGE_SIZE):
+            region[offset] = 0
+    
+    # Hand out memoryviews, not the region or bytearrays: slicing a memoryview
+    # (buf[:nbytes] for the final partial write) is zero-copy, while slicing
+    # an mmap or bytearray allocates a copy. The views keep the mapping alive.
+    view = memoryview(region)
+    base = 0
+    if alignment > PAGE_SIZE:
+        import ctypes
+        address = ctypes.addressof(ctypes.c_char.from_buffer(view))
+        base = -address % alignment
+    return [view[base + i * stride:base + i * stride + buffer_size] for i in range(buffer_count)]
+
+
+def parse_cpulist(cpulist: str) -> set:
+    """Parse a sysfs cpulist string such as "0-3,8-11" into a set of CPU ids"""
+    cpus = set()
+    for part in cpulist.strip().split(','):
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-')
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    return cpus
+
+
+def get_numa_node_cpus() -> dict:
+    """
+    Map each NUMA node to the CPUs it owns (from /sys/devices/system/node).
+    
+    Only CPUs this process may run on are included; nodes with none are
+    skipped.
+    
+    Returns:
+        dict of node id -> set of CPU ids (empty if topology is unavailable)
+    """
+    node_root = '/sys/devices/system/node'
+    allowed = os.sched_getaffinity(0) if hasattr(os, 'sched_getaffinity') else None
+    node_cpus = {}
+    try:
+        entries = os.listdir(node_root)
+    except OSError:
+        return node_cpus
+    
+    for entry in entries:
+        if not re.fullmatch(r'node\d+', entry):
+            continue
+        try:
+            with open(os.path.join(node_root, entry, 'cpulist')) as f:
+                cpus = parse_cpulist(f.read())
+        except (OSError, ValueError):
+            continue
+        if allowed is not None:
+            cpus &= allowed
+        if cpus:
+            node_cpus[int(entry[4:])] = cpus
+    return node_cpus
+
+
+def sysfs_block_device(path: str) -> Optional[str]:
+    """
+    Resolve the sysfs directory of the block device holding `path`.
+    
+    Uses /sys/dev/block/MAJOR:MINOR of the file (or, if it does not exist
+    yet, of its directory). For a partition this is the partition's
+    directory, nested under its disk.
+    
+    Returns:
+        Path under /sys/devices, or None (non-Linux, non-block filesystems)
+    """
+    target = path if os.path.exists(path) else (os.path.dirname(os.path.abspath(path)) or '.')
+    try:
+        st_dev = os.stat(target).st_dev
+        sys_dev = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+    except OSError:
+        return None
+    return sys_dev if sys_dev.startswith('/sys/devices/') else None
+
+
+def read_sysfs_int(sys_dev: Optional[str], attribute: str) -> Optional[int]:
+    """Read an integer attribute from sys_dev or its nearest ancestor that has it"""
+    while sys_dev and sys_dev.startswith('/sys/devices/'):
+        try:
+            with open(os.path.join(sys_dev, attribute)) as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            sys_dev = os.path.dirname(sys_dev)
+    return None
+
+
+def get_device_numa_node(path: str) -> Optional[int]:
+    """
+    Find the NUMA node the block device holding `path` is attached to.
+    
+    Walks up the sysfs device tree (partition -> disk -> controller -> PCI
+    function) to the first numa_node attribute.
+    
+    Returns:
+        NUMA node id, or None if unknown (virtual devices, single-node systems)
+    """
+    node = read_sysfs_int(sysfs_block_device(path), 'numa_node')
+    return node if node is not None and node >= 0 else None
+
+
+def get_device_block_size(path: str) -> Optional[int]:
+    """
+    Find the logical block size of the block device holding `path`.
+    
+    This is the O_DIRECT alignment unit for buffer addresses, sizes and file
+    offsets: 512 on 512e drives, 4096 on 4Kn drives, larger on some NVMe.
+    Partitions report their disk's queue limits.
+    
+    Returns:
+        Block size in bytes, or None if unknown
+    """
+    return read_sysfs_int(sysfs_block_device(path), 'queue/logical_block_size')
+
+
+def allocate_numa_local_pool(buffer_size: int, buffer_count: int, cpus: set,
+                             huge_pages: bool = False, alignment: int = PAGE_SIZE) -> list:
+    """
+    Allocate a buffer pool whose pages live on the NUMA node owning `cpus`.
+    
+    The pool is created and pre-faulted from a helper thread pinned to the
+    node's CPUs, so the kernel's first-touch policy places every page on
+    that node.
+    
+    Returns:
+        list of page-aligned buffers (see create_aligned_buffer_pool)
+    """
+    result = []
+    
+    def allocate():
+        os.sched_setaffinity(0, cpus)  # Pins only this helper thread
+        result.extend(create_aligned_buffer_pool(buffer_size, buffer_count, huge_pages, alignment))
+    
+    allocator = threading.Thread(target=allocate, name="NUMA-allocator")
+    allocator.start()
+    allocator.join()
+    return result
+
+
+# ===========================================================================
+# Buffer Handoff
+# ===========================================================================
+
+class BufferRing:
+    """
+    Buffer handoff queue with a lock-free fast path.
+    
+    queue.Queue takes a mutex and signals a condition variable on every put()
+    and get(), which serializes the pipeline at multi-GB/s buffer rates.
+    BufferRing is backed by collections.deque, whose append()/pop() are atomic
+    under the GIL, so a handoff is a single deque operation with no lock.
+    
+    get() spins briefly on an empty ring, then falls back to blocking on a
+    condition variable. put() only touches the condition when a consumer is
+    actually blocked, so the steady-state path never takes a lock.
+    put_many()/get_many() move a whole batch per call (one deque extend and
+    at most one wakeup), so per-buffer overhead is paid once per batch.
+    
+    Capacity is bounded by the buffer pool itself (every item is one pool
+    buffer or a shutdown sentinel), so the ring does not need its own limit.
+    
+    Args:
+        lifo: Pop the most recently added item first (empty buffer pool)
+              instead of the oldest (filled buffers, in offset order)
+        spin: Number of non-blocking pop attempts before blocking
+    """
+    
+    def __init__(self, lifo: bool = False, spin: int = 64):
+        self._items = collections.deque()
+        self._pop = self._items.pop if lifo else self._items.popleft
+        self._cond = threading.Condition(threading.Lock())
+        self._waiters = 0
+        self._spin = spin
+    
+    def put(self, item):
+        """Add an item, waking one blocked consumer if there is one"""
+        self._items.append(item)
+        # A consumer increments _waiters under the lock *before* its final
+        # pop attempt, so either it sees this item or we see it waiting
+        if self._waiters:
+            with self._cond:
+                self._cond.notify()
+    
+    def get(self):
+        """Remove and return an item, blocking until one is available"""
+        pop = self._pop
+        for _ in range(self._spin):
+            try:
+                return pop()
+            except IndexError:
+                pass
+        
+        with self._cond:
+            self._waiters += 1
+            try:
+                while True:
+                    try:
+                        return pop()
+                    except IndexError:
+                        self._cond.wait()
+            finally:
+                self._waiters -= 1
+    
+    def put_many(self, items: list):
+        """Add several items at once, waking blocked consumers if there are any"""
+        self._items.extend(items)
+        if self._waiters:
+            with self._cond:
+                self._cond.notify(len(items))
+    
+    def get_many(self, max_items: int) -> list:
+        """Remove and return 1 to max_items items, blocking only for the first"""
+        items = [self.get()]
+        pop = self._pop
         try:
-            buf = mmap.mmap(-1, buffer_size, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
-            pool.append(buf)
-        except Exception as e:
-            print(f"Warning: Failed to create buffer via mmap: {e}")
-            # Fallback to bytearray (not guaranteed to be aligned)
-            pool.append(bytearray(buffer_size))
+            while len(items) < max_items:
+                items.append(pop())
+        except IndexError:
+            pass
+        return items
+    
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# ===========================================================================
+# Page Cache Helpers
+# ===========================================================================
+
+# sync_file_range(2) flags (linux/fs.h)
+SYNC_FILE_RANGE_WAIT_BEFORE = 1
+SYNC_FILE_RANGE_WRITE = 2
+SYNC_FILE_RANGE_WAIT_AFTER = 4
+
+# How often buffered writers push dirty pages to storage
+WRITEBACK_INTERVAL_BYTES = 1024**3  # 1 GB
+
+_libc = None
+
+
+def _get_libc():
+    """Load libc once via ctypes (None if unavailable, e.g. non-Linux)"""
+    global _libc
+    if _libc is None:
+        import ctypes
+        import ctypes.util
+        try:
+            _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        except OSError:
+            _libc = False
+    return _libc or None
+
+
+def sync_file_range(fd: int, offset: int, nbytes: int, flags: int) -> bool:
+    """
+    Call Linux sync_file_range(2) via ctypes.
+    
+    Unlike fsync(), this only writes back data pages for the given range and
+    never forces a metadata journal commit. nbytes=0 means "to end of file".
+    
+    Returns:
+        True on success, False if unsupported on this platform/filesystem
+    """
+    import ctypes
+    
+    libc = _get_libc()
+    if libc is None or not hasattr(libc, 'sync_file_range'):
+        return False
+    
+    ret = libc.sync_file_range(ctypes.c_int(fd), ctypes.c_int64(offset),
+                               ctypes.c_int64(nbytes), ctypes.c_uint(flags))
+    return ret == 0
+
+
+def flush_file_data(fd: int):
+    """
+    Flush written data for fd without a full fsync().
+    
+    Starts and waits for writeback of all dirty pages, then issues fdatasync()
+    to flush the device write cache. For a file that is only written in place
+    this skips the metadata journal flush that fsync() would add to the
+    reported total time.
+    """
+    sync_file_range(fd, 0, 0, SYNC_FILE_RANGE_WRITE | SYNC_FILE_RANGE_WAIT_AFTER)
+    if hasattr(os, 'fdatasync'):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+# ===========================================================================
+# Vectored Writes
+# ===========================================================================
+
+# Maximum buffers submitted in one pwritev() call. Producers hand each writer
+# stripes of this many file-contiguous buffers so batches can be merged.
+MAX_WRITE_BATCH = 8
+
+# Queue wait times are sampled: the first WAIT_SAMPLE_INTERVAL handoffs are
+# all timed (so startup waits are counted exactly), then one handoff in
+# WAIT_SAMPLE_INTERVAL, keeping perf_counter() calls off most iterations.
+# Must be a power of two.
+WAIT_SAMPLE_INTERVAL = 16
+
+
+class WaitSampler:
+    """
+    Estimate total time spent blocked on a queue from sampled handoffs.
+    
+    Call due() before each handoff; if it returns True, time the handoff
+    and pass the duration to record(). total() extrapolates the sampled
+    handoffs' mean wait over the untimed ones.
+    """
+    
+    def __init__(self):
+        self.handoffs = 0
+        self.exact = 0.0    # Sum of the first WAIT_SAMPLE_INTERVAL waits
+        self.sampled = 0.0  # Sum of sampled waits after that
+        self.samples = 0
+    
+    def due(self) -> bool:
+        """Count a handoff; True if it should be timed"""
+        handoffs = self.handoffs
+        self.handoffs = handoffs + 1
+        return handoffs < WAIT_SAMPLE_INTERVAL or not handoffs & (WAIT_SAMPLE_INTERVAL - 1)
+    
+    def record(self, wait_time: float):
+        if self.handoffs <= WAIT_SAMPLE_INTERVAL:
+            self.exact += wait_time
+        else:
+            self.sampled += wait_time
+            self.samples += 1
+    
+    def total(self) -> float:
+        """Estimated total wait time in seconds"""
+        if not self.samples:
+            return self.exact
+        return self.exact + self.sampled * (self.handoffs - WAIT_SAMPLE_INTERVAL) / self.samples
+
+
+def contiguous_runs(batch: list):
+    """Split (buf, nbytes, offset) items into runs that are contiguous in the file"""
+    run = [batch[0]]
+    for item in batch[1:]:
+        _, prev_nbytes, prev_offset = run[-1]
+        if item[2] == prev_offset + prev_nbytes:
+            run.append(item)
+        else:
+            yield run
+            run = [item]
+    yield run
+
+
+def write_run(fd: int, run: list) -> int:
+    """
+    Write a run of file-contiguous (buf, nbytes, offset) items.
+    
+    Multi-buffer runs are submitted with a single pwritev() syscall where
+    available. Each buffer is already page-aligned and sized, so O_DIRECT
+    alignment is preserved across the whole vector. Buffers are memoryviews,
+    so buf[:nbytes] is a view of the pool memory, never a copy.
+    
+    Returns:
+        Total bytes written
+    """
+    offset = run[0][2]
+    
+    if len(run) > 1 and hasattr(os, 'pwritev'):
+        return os.pwritev(fd, [buf[:nbytes] for buf, nbytes, _ in run], offset)
+    
+    written = 0
+    for buf, nbytes, item_offset in run:
+        if hasattr(os, 'pwrite'):
+            written += os.pwrite(fd, buf[:nbytes], item_offset)
+        else:
+            # pwrite not available, fall back to seek + write
+            os.lseek(fd, item_offset, os.SEEK_SET)
+            written += os.write(fd, buf[:nbytes])
+    return written
+
+
+# Granularity of --sparse zero detection. Each all-zero range of this size
+# (aligned within its buffer) is skipped instead of written.
+SPARSE_CHUNK_SIZE = 64 * 1024
+_ZERO_CHUNK = bytes(SPARSE_CHUNK_SIZE)
+
+
+def split_zero_ranges(batch: list) -> tuple:
+    """
+    Split (buf, nbytes, offset) items into their non-zero segments.
+    
+    With compress_ratio > 1 the generator zero-fills the tail of each block.
+    Skipping those ranges on a freshly truncated file leaves them as holes,
+    which read back as zeros. The all-zero test is bytes.startswith() against
+    a zero chunk: one memcmp() on the buffer, with no copy, which stops at
+    the first byte of a random-data chunk.
+    
+    Returns:
+        (segments, skipped_bytes) - segments are (buf slice, nbytes, offset)
+        items that still need writing
+    """
+    segments = []
+    skipped = 0
+    is_zero = _ZERO_CHUNK.startswith
+    
+    for buf, nbytes, offset in batch:
+        start = None  # Start of the current data segment
+        for pos in range(0, nbytes, SPARSE_CHUNK_SIZE):
+            end = min(pos + SPARSE_CHUNK_SIZE, nbytes)
+            if is_zero(buf[pos:end]):
+                if start is not None:
+                    segments.append((buf[start:pos], pos - start, offset + start))
+                    start = None
+                skipped += end - pos
+            elif start is None:
+                start = pos
+        if start is not None:
+            segments.append((buf[start:nbytes], nbytes - start, offset + start))
+    
+    return segments, skipped
+
+
+def dedup_source_offset(offset: int, buffer_size: int, group: int) -> int:
+    """
+    File offset of the buffer that a --dedup-copy duplicate at `offset` copies.
+    
+    Buffers form groups of `group` within each stripe: the first buffer of a
+    group is generated and written, the rest duplicate it. Groups never span
+    stripes, so the source always went to the same writer, earlier in order.
+    """
+    stripe_size = buffer_size * MAX_WRITE_BATCH
+    stripe_start = offset - offset % stripe_size
+    index = (offset - stripe_start) // buffer_size
+    return stripe_start + (index - index % group) * buffer_size
+
+
+class DuplicateCopier:
+    """
+    Duplicate already-written ranges of a file with copy_file_range().
+    
+    On filesystems with reflink support (btrfs, XFS with reflink=1) the
+    kernel shares the extents and no data is rewritten; elsewhere it copies
+    in-kernel without a round trip through user space. If copy_file_range()
+    is unavailable or unsupported, ranges are read back into an aligned
+    scratch buffer and rewritten.
+    """
+    
+    def __init__(self, fd: int, buffer_size: int, alignment: int):
+        self.fd = fd
+        self.buffer_size = buffer_size
+        self.alignment = alignment
+        self.supported = hasattr(os, 'copy_file_range')
+        self.scratch = None
+    
+    def copy(self, src_offset: int, dst_offset: int, nbytes: int):
+        if self.supported:
+            done = 0
+            try:
+                while done < nbytes:
+                    copied = os.copy_file_range(self.fd, self.fd, nbytes - done,
+                                                src_offset + done, dst_offset + done)
+                    if copied == 0:
+                        break
+                    done += copied
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                    raise
+                self.supported = False
+            if done == nbytes:
+                return
+        
+        # Fallback: read the source back and rewrite it
+        if self.scratch is None:
+            self.scratch = create_aligned_buffer_pool(self.buffer_size, 1, alignment=self.alignment)[0]
+        data = self.scratch[:nbytes]
+        if os.preadv(self.fd, [data], src_offset) != nbytes:
+            raise IOError(f"Short read duplicating offset {src_offset}")
+        if os.pwrite(self.fd, data, dst_offset) != nbytes:
+            raise IOError(f"Partial write: duplicating to offset {dst_offset}")
+
+
+def write_runs(fd: int, runs: list) -> list:
+    """
+    Write a list of runs (see contiguous_runs) and pair each with its result.
+    
+    Uses dgen_py.write_runs() when available, which issues every pwritev()
+    of the batch from Rust with the GIL released; otherwise falls back to
+    write_run() per run.
+    
+    Returns:
+        list of (run, bytes_written) pairs
+    """
+    if not runs:
+        return []
+    if native_write_runs is not None:
+        return list(zip(runs, native_write_runs(fd, runs)))
+    return [(run, write_run(fd, run)) for run in runs]
+
+
+class UringWriter:
+    """
+    Asynchronous positioned writes through io_uring (requires liburing).
+    
+    Each writer thread owns one ring. Runs of file-contiguous buffers are
+    queued with submit() as one writev each, and finished runs are collected
+    with reap(); up to queue_depth runs stay in flight, so the device sees a
+    deep queue without a syscall per buffer. Completions are returned as
+    (run, bytes_written) pairs, matching the synchronous write path.
     
-    return pool
+    The bindings raise OSError instead of returning negative errno values:
+    io_uring_peek_cqe() raises BlockingIOError when nothing has completed,
+    and reading CQE.res raises for a failed write.
+    """
+    
+    def __init__(self, fd: int, queue_depth: int):
+        self.fd = fd
+        self.queue_depth = queue_depth
+        self.ring = liburing.Ring()
+        liburing.io_uring_queue_init(queue_depth, self.ring)
+        self.cqe = liburing.Cqe()
+        # user_data token -> (run, Iovec). The Iovec holds raw pointers into
+        # the run's memoryviews, so both must stay referenced until completion.
+        self.inflight = {}
+        self.next_token = 0
+    
+    def submit(self, items: list) -> list:
+        """
+        Queue writes for (buf, nbytes, offset) items and submit them.
+        
+        Returns:
+            Completions reaped while waiting for queue space
+        """
+        completed = []
+        for run in (contiguous_runs(items) if items else ()):
+            if len(self.inflight) >= self.queue_depth:
+                # Writes prepared earlier in this call must be submitted
+                # before one of them can complete
+                liburing.io_uring_submit(self.ring)
+                completed.extend(self.reap(wait=True))
+            
+            sqe = liburing.io_uring_get_sqe(self.ring)
+            while sqe is None:
+                # Submission queue full - submit and wait for a completion
+                liburing.io_uring_submit(self.ring)
+                completed.extend(self.reap(wait=True))
+                sqe = liburing.io_uring_get_sqe(self.ring)
+            
+            iovec = liburing.Iovec([buf[:nbytes] for buf, nbytes, _ in run])
+            liburing.io_uring_prep_writev(sqe, self.fd, iovec, run[0][2])
+            liburing.io_uring_sqe_set_data64(sqe, self.next_token)
+            self.inflight[self.next_token] = (run, iovec)
+            self.next_token += 1
+        
+        liburing.io_uring_submit(self.ring)
+        return completed
+    
+    def reap(self, wait: bool = False) -> list:
+        """Collect finished writes (blocking for at least one if wait=True)"""
+        completed = []
+        while self.inflight:
+            try:
+                if wait and not completed:
+                    liburing.io_uring_wait_cqe(self.ring, self.cqe)
+                else:
+                    liburing.io_uring_peek_cqe(self.ring, self.cqe)
+            except BlockingIOError:
+                break  # Nothing finished yet
+            
+            cqe = self.cqe[0]
+            run, _ = self.inflight.pop(cqe.user_data)
+            try:
+                written = cqe.res  # Raises OSError if the write failed
+            finally:
+                liburing.io_uring_cqe_seen(self.ring, cqe)
+            completed.append((run, written))
+        return completed
+    
+    def drain(self) -> list:
+        """Wait for every in-flight write to finish"""
+        completed = []
+        while self.inflight:
+            completed.extend(self.reap(wait=True))
+        return completed
+    
+    def close(self):
+        liburing.io_uring_queue_exit(self.ring)
 
 
 # ===========================================================================
@@ -236,218 +1006,356 @@ def create_aligned_buffer_pool(buffer_size: int, buffer_count: int):
 # ===========================================================================
 
 def producer_thread(
+    producer_id: int,
     config: BenchmarkConfig,
-    empty_buffers: queue.Queue,
-    full_buffers_list: list,  # List of queues for multiple writers
+    empty_rings: list,  # Empty-buffer BufferRing per writer (shared by writers on one NUMA node)
+    full_buffers_list: list,  # List of BufferRings, one per writer
+    writers: list,  # Writer indices this producer feeds (one NUMA node's writers, or all)
+    offsets,  # Shared itertools.count(step=stripe size) - next file stripe to fill
     stats: BenchmarkStats,
+    stats_lock: threading.Lock,
     error_event: threading.Event
 ):
     """
     Generate data using dgen-py and fill buffers.
     
-    This thread runs the Generator in streaming mode, filling buffers from
-    the pool and distributing them round-robin to multiple writer threads.
+    Multiple instances of this thread can run in parallel, each with its own
+    Generator. Producers claim stripes of MAX_WRITE_BATCH buffers from a
+    shared offset counter, so every buffer carries the position it must be
+    written at, and hand out whole stripes round-robin to their `writers`.
+    Each stripe is filled from its writer's empty ring, so buffers stay on
+    the writer's NUMA node.
     """
+    thread_name = f"Producer-{producer_id}"
+    
+    # Per-producer statistics (published to shared stats once, at exit)
+    total_generated = 0
+    waits = WaitSampler()  # Time blocked on empty_buffers
+    free = []
+    filled = []
+    
     try:
-        print(f"[Producer] Starting data generation ({config.total_size / 1e9:.2f} GB)")
+        if producer_id == 0:
+            print(f"[Producer] Starting data generation ({config.total_size / 1e9:.2f} GB, "
+                  f"{config.num_producers} thread(s))")
+        
+        # Split generation threads between producers to avoid oversubscription
+        max_threads = config.max_threads
+        if config.num_producers > 1:
+            max_threads = max(1, (max_threads or os.cpu_count() or 1) // config.num_producers)
         
-        # Create streaming generator
+        # Create streaming generator (sized for the whole run; the shared
+        # offset counter decides how much each producer actually generates)
         gen = dgen_py.Generator(
             size=config.total_size,
             dedup_ratio=config.dedup_ratio,
             compress_ratio=config.compress_ratio,
             numa_mode=config.numa_mode,
-            max_threads=config.max_threads
+            max_threads=max_threads
         )
         
-        total_generated = 0
-        buffer_num = 0
-        writer_index = 0  # Round-robin index for distributing to writers
+        progress = stats.generated_progress.values
+        progress_slot = stats.generated_progress.slot(producer_id)
         
-        while not gen.is_complete() and not error_event.is_set():
-            # Get an empty buffer (blocks if none available)
-            wait_start = time.perf_counter()
-            buf = empty_buffers.get()
-            wait_time = time.perf_counter() - wait_start
-            stats.producer_wait_time += wait_time
-            
-            if buf is None:  # Shutdown signal
+        position = producer_id % len(writers)  # Round-robin position in `writers`
+        stripe_size = config.buffer_size * MAX_WRITE_BATCH
+        stopped = False
+        
+        # --dedup-copy: only the first buffer of each group is generated; the
+        # rest are sent as (None, nbytes, offset) for the writer to duplicate
+        dedup_group = int(config.dedup_ratio) if config.dedup_copy else 1
+        
+        while not stopped and not error_event.is_set():
+            # Claim the next stripe of the output file. A whole stripe goes to
+            # one writer so it can merge the buffers into one vectored write.
+            stripe_offset = next(offsets)
+            if stripe_offset >= config.total_size:
                 break
+            stripe_end = min(stripe_offset + stripe_size, config.total_size)
+            writer_index = writers[position]
+            full_buffers = full_buffers_list[writer_index]
+            empty_buffers = empty_rings[writer_index]
             
-            # Generate data directly into buffer (ZERO-COPY!)
-            nbytes = gen.fill_chunk(buf)
+            free = []     # Empty buffers taken for this stripe, in pop order
+            filled = []   # (buf, nbytes, offset) not yet handed to the writer
             
-            if nbytes == 0:
-                # Generator exhausted, return buffer and stop
-                empty_buffers.put(buf)
-                break
-            
-            total_generated += nbytes
-            buffer_num += 1
+            for offset in range(stripe_offset, stripe_end, config.buffer_size):
+                nbytes = min(config.buffer_size, config.total_size - offset)
+                
+                if dedup_group > 1 and (offset - stripe_offset) // config.buffer_size % dedup_group:
+                    # Not generated: the writer counts these as copied_bytes
+                    filled.append((None, nbytes, offset))
+                    continue
+                
+                if not free:
+                    # Hand over what is filled before blocking, so a small pool
+                    # can't deadlock with buffers held here
+                    if filled:
+                        full_buffers.put_many(filled)
+                        filled = []
+                    
+                    # Get empty buffers for the rest of the stripe (blocks if none available)
+                    wanted = -(-(stripe_end - offset) // config.buffer_size)
+                    if waits.due():
+                        wait_start = time.perf_counter()
+                        free = empty_buffers.get_many(wanted)
+                        waits.record(time.perf_counter() - wait_start)
+                    else:
+                        free = empty_buffers.get_many(wanted)
+                    free.reverse()
+                
+                buf = free.pop()
+                if buf is None:  # Shutdown signal
+                    stopped = True
+                    break
+                
+                # Generate data directly into buffer (ZERO-COPY!)
+                if nbytes < config.buffer_size:
+                    nbytes = gen.fill_chunk(buf[:nbytes])  # Final partial buffer
+                else:
+                    nbytes = gen.fill_chunk(buf)
+                
+                if nbytes == 0:
+                    # Generator exhausted, return buffer and stop
+                    free.append(buf)
+                    stopped = True
+                    break
+                
+                total_generated += nbytes
+                progress[progress_slot] = total_generated
+                filled.append((buf, nbytes, offset))
             
-            # Pass filled buffer to consumer (round-robin across writers)
-            full_buffers_list[writer_index].put((buf, nbytes))
-            writer_index = (writer_index + 1) % config.num_writers
+            # Pass filled buffers to this stripe's writer in one handoff, and
+            # return any unused ones (including other producers' shutdown signals)
+            if filled:
+                full_buffers.put_many(filled)
+            if free:
+                empty_buffers.put_many(free)
             
-            # Progress update every 100 buffers
-            if buffer_num % 100 == 0:
-                progress_pct = (total_generated / config.total_size) * 100
-                elapsed = time.perf_counter() - stats.start_time
-                throughput = (total_generated / elapsed) / 1e9
-                print(f"[Producer] Generated: {total_generated / 1e9:.2f} GB "
-                      f"({progress_pct:.1f}%) @ {throughput:.2f} GB/s", end='\r')
-        
-        stats.bytes_generated = total_generated
-        print(f"\n[Producer] Complete: {total_generated / 1e9:.2f} GB generated")
+            position = (position + 1) % len(writers)
         
-        # Signal all consumers that we're done
-        for full_buffers in full_buffers_list:
-            full_buffers.put(None)
+        if config.num_producers > 1:
+            print(f"\n[{thread_name}] Complete: {total_generated / 1e9:.2f} GB generated")
+        else:
+            print(f"\n[Producer] Complete: {total_generated / 1e9:.2f} GB generated")
         
     except Exception as e:
-        print(f"\n[Producer] ERROR: {e}")
+        print(f"\n[{thread_name}] ERROR: {e}")
         error_event.set()
-        # Signal all consumers to stop
-        for full_buffers in full_buffers_list:
-            full_buffers.put(None)
+        # Return this stripe's buffers (the writer will never see them), then
+        # unblock other producers waiting for buffers that won't come back
+        unused = free + [buf for buf, _, _ in filled if buf is not None]
+        if unused:
+            empty_buffers.put_many(unused)
+        for ring in {id(ring): ring for ring in empty_rings}.values():
+            for _ in range(config.num_producers):
+                ring.put(None)
+    
+    finally:
+        # Update global stats (thread-safe)
+        with stats_lock:
+            stats.bytes_generated += total_generated
+            stats.producer_wait_time += waits.total()
 
 
 # ===========================================================================
 # Consumer Thread (Disk Writer)
 # ===========================================================================
 
+def open_output_flags(config: BenchmarkConfig) -> int:
+    """
+    Truncate the output file and decide once how writers will open it.
+    
+    When O_DIRECT is requested, the file is opened with O_DIRECT and one
+    aligned block is written at offset 0. Some filesystems accept the open
+    but reject the first write, so both must succeed. Every writer then
+    opens the file with the returned flags, so all writers agree on the
+    mode and none of them needs a fallback path.
+    
+    Returns:
+        os.open() flags for writer threads (O_DIRECT included if usable)
+    """
+    # --dedup-copy reads duplicates' sources back from the same fd
+    flags = (os.O_RDWR if config.dedup_copy else os.O_WRONLY) | os.O_CREAT
+    
+    # Truncate once here; a writer truncating could discard another's data
+    os.close(os.open(config.output_path, flags | os.O_TRUNC, 0o644))
+    
+    if not config.use_direct_io:
+        return flags
+    
+    if not hasattr(os, 'O_DIRECT'):
+        print(f"[Writers] ⚠ O_DIRECT not available on {platform.system()}")
+        print(f"[Writers] → Using BUFFERED I/O (page cache will be used)")
+        return flags
+    
+    try:
+        fd = os.open(config.output_path, flags | os.O_DIRECT, 0o644)
+        try:
+            block = create_aligned_buffer_pool(config.alignment, 1, alignment=config.alignment)[0]
+            os.pwrite(fd, block, 0)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        # O_DIRECT not supported by filesystem, fall back to buffered
+        print(f"[Writers] ⚠ O_DIRECT FAILED ({e})")
+        print(f"[Writers] → Falling back to BUFFERED I/O (page cache will be used)")
+        print(f"[Writers] → This is common with /tmp (tmpfs) and some network filesystems")
+        return flags
+    
+    print(f"[Writers] ✓ O_DIRECT ENABLED (page cache bypass)")
+    return flags | os.O_DIRECT
+
+
+def print_page_cache_note(thread_name: str, has_fadvise: bool):
+    """Explain how the buffered-I/O path keeps results comparable to O_DIRECT"""
+    if has_fadvise:
+        print(f"[{thread_name}] → Written pages are dropped from the page cache "
+              f"(POSIX_FADV_DONTNEED) to keep results comparable to O_DIRECT")
+    else:
+        print(f"[{thread_name}] → posix_fadvise unavailable: page cache may inflate results")
+
+
 def consumer_thread(
     writer_id: int,
     config: BenchmarkConfig,
-    empty_buffers: queue.Queue,
-    full_buffers: queue.Queue,
+    empty_rings: list,  # Empty-buffer BufferRing per writer (shared by writers on one NUMA node)
+    full_buffers: BufferRing,
+    cpus: Optional[set],  # CPUs of this writer's NUMA node (None = no pinning)
+    open_flags: int,  # From open_output_flags() - includes O_DIRECT if usable
     stats: BenchmarkStats,
-    stats_lock: threading.Lock,
     error_event: threading.Event
 ):
     """
     Write buffers to storage using O_DIRECT (when supported).
     
-    Multiple instances of this thread can run in parallel, each writing
-    sequentially to keep track of their position in the file.
+    Multiple instances of this thread can run in parallel. Each buffer carries
+    its own file offset; buffers already queued for this writer are drained
+    into a batch and file-contiguous runs are written with one pwritev().
+    With per-node pools the writer is pinned to its node's CPUs.
     """
+    empty_buffers = empty_rings[writer_id]
     fd = None
-    use_direct_io = False  # Track actual I/O mode used
+    uring = None
+    use_direct_io = bool(open_flags & getattr(os, 'O_DIRECT', 0))
     thread_name = f"Writer-{writer_id}"
     
     # Per-writer statistics
     local_bytes_written = 0
     local_write_count = 0
-    local_wait_time = 0.0
+    local_sparse_bytes = 0
+    local_copied_bytes = 0
+    waits = WaitSampler()  # Time blocked on full_buffers
     
     try:
-        if writer_id == 0:  # Only first writer prints
-            print(f"[{thread_name}] Opening file: {config.output_path}")
+        if cpus is not None:
+            os.sched_setaffinity(0, cpus)  # Stay local to this writer's buffer pool
         
-        # Open file with O_DIRECT if requested and supported
-        flags = os.O_WRONLY | os.O_CREAT
-        if writer_id == 0:
-            flags |= os.O_TRUNC  # Only first writer truncates
+        fd = os.open(config.output_path, open_flags, 0o644)
+        if writer_id == 0 and config.num_writers > 1:
+            print(f"[Writers] Launching {config.num_writers} parallel writer threads")
         
-        use_direct = False
+        has_fadvise = hasattr(os, 'posix_fadvise')
+        if not use_direct_io and writer_id == 0:
+            print_page_cache_note(thread_name, has_fadvise)
         
-        if config.use_direct_io and hasattr(os, 'O_DIRECT'):
-            # Try O_DIRECT first
-            try:
-                fd = os.open(config.output_path, flags | os.O_DIRECT, 0o644)
-                use_direct = True
-                use_direct_io = True
-                if writer_id == 0:
-                    print(f"[{thread_name}] ✓ O_DIRECT ENABLED (page cache bypass)")
-                    if config.num_writers > 1:
-                        print(f"[Writers] Launching {config.num_writers} parallel writer threads")
-            except OSError as e:
-                # O_DIRECT not supported by filesystem, fall back to buffered
-                if writer_id == 0:
-                    print(f"[{thread_name}] ⚠ O_DIRECT FAILED ({e})")
-                    print(f"[{thread_name}] → Falling back to BUFFERED I/O (page cache will be used)")
-                    print(f"[{thread_name}] → This is common with /tmp (tmpfs) and some network filesystems")
-                fd = os.open(config.output_path, flags, 0o644)
-                use_direct_io = False
-        else:
-            if config.use_direct_io and writer_id == 0:
-                print(f"[{thread_name}] ⚠ O_DIRECT not available on {platform.system()}")
-                print(f"[{thread_name}] → Using BUFFERED I/O (page cache will be used)")
-            fd = os.open(config.output_path, flags, 0o644)
-            use_direct_io = False
+        progress = stats.written_progress.values
+        progress_slot = stats.written_progress.slot(writer_id)
         
-        # Track current file offset for this writer
-        current_offset = 0
-        first_write = True
+        # io_uring engine: keep many writes in flight instead of one per syscall
+        if config.io_engine == 'uring':
+            uring = UringWriter(fd, config.queue_depth)
+        
+        if config.dedup_copy:
+            copier = DuplicateCopier(fd, config.buffer_size, config.alignment)
+            dedup_group = int(config.dedup_ratio)
+        
+        # Buffered I/O: start writeback periodically so dirty pages in the
+        # page cache stay bounded instead of growing with the test size
+        unsynced_bytes = 0
+        shutdown = False
+        freed = []  # Written buffers waiting to go back to the pool
         
         while not error_event.is_set():
-            # Get a filled buffer (blocks if none available)
-            wait_start = time.perf_counter()
-            item = full_buffers.get()
-            wait_time = time.perf_counter() - wait_start
-            local_wait_time += wait_time
-            
-            if item is None:  # Shutdown signal
-                break
-            
-            buf, nbytes = item
+            # Get filled buffers (blocks until at least one is available) and
+            # take whatever else is already queued into the same batch
+            if waits.due():
+                wait_start = time.perf_counter()
+                batch = full_buffers.get_many(MAX_WRITE_BATCH)
+                waits.record(time.perf_counter() - wait_start)
+            else:
+                batch = full_buffers.get_many(MAX_WRITE_BATCH)
             
-            # Write to file at current offset using pwrite (thread-safe positioned write)
-            write_start = time.perf_counter()
-            try:
-                written = os.pwrite(fd, buf[:nbytes], current_offset)
-                current_offset += written
-            except (OSError, AttributeError) as e:
-                # Handle O_DIRECT failure or pwrite not available
-                if first_write and use_direct:
-                    if writer_id == 0:
-                        print(f"\n[{thread_name}] ⚠ O_DIRECT write failed ({e})")
-                        print(f"[{thread_name}] → Reopening file with BUFFERED I/O")
-                    os.close(fd)
-                    fd = os.open(config.output_path, flags, 0o644)
-                    use_direct = False
-                    use_direct_io = False
-                    written = os.pwrite(fd, buf[:nbytes], current_offset)
-                    current_offset += written
-                elif isinstance(e, AttributeError):
-                    # pwrite not available, fall back to sequential write
-                    written = os.write(fd, buf[:nbytes])
-                else:
-                    raise
+            if batch[-1] is None:  # Shutdown signal (always last) - write this batch first
+                batch.pop()
+                shutdown = True
             
-            first_write = False
+            # Issue writes; completed is a list of (run, bytes_written) pairs
+            if uring is not None:
+                completed = uring.submit(batch)
+                completed.extend(uring.drain() if shutdown else uring.reap())
+            else:
+                items = batch
+                duplicates = ()
+                if config.dedup_copy:
+                    duplicates = [item for item in batch if item[0] is None]
+                    items = [item for item in batch if item[0] is not None]
+                
+                if config.sparse:
+                    # Leave all-zero ranges as holes; count them as written
+                    items, skipped = split_zero_ranges(items)
+                    local_sparse_bytes += skipped
+                    local_bytes_written += skipped
+                
+                # One positioned write (pwritev) per run of file-contiguous buffers
+                completed = write_runs(fd, list(contiguous_runs(items)) if items else [])
+                
+                # Duplicates last: their sources are written by now (earlier in
+                # this batch or in a previous one)
+                for _, nbytes, offset in duplicates:
+                    copier.copy(dedup_source_offset(offset, config.buffer_size, dedup_group),
+                                offset, nbytes)
+                    local_copied_bytes += nbytes
+                    local_bytes_written += nbytes
             
-            if written != nbytes:
-                raise IOError(f"Partial write: {written} != {nbytes}")
+            for run, written in completed:
+                offset = run[0][2]
+                nbytes = sum(item_nbytes for _, item_nbytes, _ in run)
+                
+                if written != nbytes:
+                    raise IOError(f"Partial write: {written} != {nbytes}")
+                
+                local_bytes_written += written
+                local_write_count += len(run)
+                
+                if not use_direct_io:
+                    # Drop the just-written pages from the page cache so buffered
+                    # runs don't get an artificial speedup from cache absorption
+                    # (dirty pages are queued for writeback and dropped once clean)
+                    if has_fadvise:
+                        os.posix_fadvise(fd, offset, written, os.POSIX_FADV_DONTNEED)
+                    
+                    unsynced_bytes += written
+                    if unsynced_bytes >= WRITEBACK_INTERVAL_BYTES:
+                        # Writers fill interleaved regions - start async writeback file-wide
+                        sync_file_range(fd, 0, 0, SYNC_FILE_RANGE_WRITE)
+                        unsynced_bytes = 0
+                
+                if uring is not None:
+                    freed.extend(buf for buf, _, _ in run)
             
-            local_bytes_written += written
-            local_write_count += 1
+            if uring is None:
+                # Synchronous writes are complete; runs may hold sub-slices (--sparse)
+                freed.extend(buf for buf, _, _ in batch if buf is not None)
+            progress[progress_slot] = local_bytes_written
             
-            # Return buffer to pool
-            empty_buffers.put(buf)
+            # Return the batch's buffers to the pool in one handoff
+            if freed:
+                empty_buffers.put_many(freed)
+                freed = []
             
-            # Progress update every 50 writes (only writer 0)
-            if writer_id == 0 and local_write_count % 50 == 0:
-                with stats_lock:
-                    total_written = stats.bytes_written
-                elapsed = time.perf_counter() - stats.start_time
-                throughput = (total_written / elapsed) / 1e9 if elapsed > 0 else 0
-                print(f"[Writers] Written: {total_written / 1e9:.2f} GB "
-                      f"@ {throughput:.2f} GB/s ({config.num_writers} threads)", end='\r')
-        
-        # Update global stats (thread-safe)
-        with stats_lock:
-            stats.bytes_written += local_bytes_written
-            stats.write_count += local_write_count
-            stats.consumer_wait_time += local_wait_time
-            stats.used_direct_io = use_direct_io  # Last writer wins (should all be same)
-            
-            # Store per-writer stats
-            stats.writer_stats[writer_id] = {
-                'bytes': local_bytes_written,
-                'writes': local_write_count,
-                'wait_time': local_wait_time
-            }
+            if shutdown:
+                break
         
         if writer_id == 0:
             print(f"\n[{thread_name}] Complete: {local_bytes_written / 1e9:.2f} GB written ({local_write_count} writes)")
@@ -455,16 +1363,74 @@ def consumer_thread(
     except Exception as e:
         print(f"\n[{thread_name}] ERROR: {e}")
         error_event.set()
+        # Unblock producers waiting for buffers this writer will never return
+        for ring in {id(ring): ring for ring in empty_rings}.values():
+            for _ in range(config.num_producers):
+                ring.put(None)
         
     finally:
+        # Publish this writer's stats once, into its own slot (no lock needed);
+        # the hot loop only touches thread-local counters
+        stats.writer_stats[writer_id] = {
+            'bytes': local_bytes_written,
+            'writes': local_write_count,
+            'wait_time': waits.total(),
+            'sparse_bytes': local_sparse_bytes,
+            'copied_bytes': local_copied_bytes
+        }
+        
+        if uring is not None:
+            uring.close()
+        
         if fd is not None:
             try:
-                os.fsync(fd)  # Ensure data is on disk
+                # Buffered data is flushed once by run_benchmark after all
+                # writers finish; per-writer flushes of the same inode serialize
                 os.close(fd)
             except:
                 pass
 
 
+# ===========================================================================
+# Progress Reporter Thread
+# ===========================================================================
+
+def reporter_thread(
+    config: BenchmarkConfig,
+    stats: BenchmarkStats,
+    done_event: threading.Event,
+    error_event: threading.Event,
+    interval: float = 1.0
+):
+    """
+    Print pipeline progress periodically.
+    
+    Runs outside the data path: producers and writers only bump their own
+    progress slot, and all formatting/printing happens here, so the hot
+    loops never stall on stdout. On Linux the thread also lowers its own
+    scheduling priority so it never preempts a producer or writer.
+    """
+    if hasattr(os, 'setpriority') and hasattr(threading, 'get_native_id'):
+        try:
+            # Linux applies PRIO_PROCESS with a thread id to that thread only
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except OSError:
+            pass
+    
+    while not done_event.wait(interval) and not error_event.is_set():
+        generated = stats.generated_progress.total()
+        written = stats.written_progress.total()
+        elapsed = time.perf_counter() - stats.start_time
+        if elapsed <= 0:
+            continue
+        
+        progress_pct = (written / config.total_size) * 100 if config.total_size else 0.0
+        print(f"[Progress] Generated: {generated / 1e9:.2f} GB "
+              f"@ {generated / elapsed / 1e9:.2f} GB/s | "
+              f"Written: {written / 1e9:.2f} GB ({progress_pct:.1f}%) "
+              f"@ {written / elapsed / 1e9:.2f} GB/s", end='\r', flush=True)
+
+
 # ===========================================================================
 # Main Benchmark Runner
 # ===========================================================================
@@ -486,12 +1452,18 @@ def run_benchmark(config: BenchmarkConfig) -> BenchmarkStats:
     print(f"  Buffer size:     {config.buffer_size / 1e6:.2f} MB")
     print(f"  Buffer count:    {config.buffer_count}")
     print(f"  Total pool:      {(config.buffer_size * config.buffer_count) / 1e9:.2f} GB")
+    print(f"  Producer threads: {config.num_producers}")
     print(f"  Writer threads:  {config.num_writers}")
     print(f"  Output file:     {config.output_path}")
     print(f"  Dedup ratio:     {config.dedup_ratio}:1")
     print(f"  Compress ratio:  {config.compress_ratio}:1")
-    print(f"  Direct I/O:      {config.use_direct_io}")
+    print(f"  Direct I/O:      {config.use_direct_io} (alignment {config.alignment} bytes)")
+    if config.io_engine == 'uring':
+        print(f"  I/O engine:      io_uring (queue depth {config.queue_depth})")
+    else:
+        print(f"  I/O engine:      sync (pwrite/pwritev)")
     print(f"  NUMA mode:       {config.numa_mode}")
+    print(f"  Writer affinity: {config.writer_affinity}")
     
     # System info
     info = dgen_py.get_system_info()
@@ -502,62 +1474,177 @@ def run_benchmark(config: BenchmarkConfig) -> BenchmarkStats:
     
     print("\n" + "=" * 70)
     
-    # Create buffer pool
-    print(f"\nAllocating {config.buffer_count} aligned buffers...")
-    pool = create_aligned_buffer_pool(config.buffer_size, config.buffer_count)
+    # Per-NUMA-node pools: each writer is assigned a node and that node's
+    # buffers are first-touched there, so write DMA never crosses sockets.
+    # 'auto' spreads writers across nodes; 'numa' keeps them all on the node
+    # the output device's PCIe root complex is attached to.
+    node_cpus = {}
+    if (config.numa_mode != 'disabled' and config.writer_affinity != 'none'
+            and hasattr(os, 'sched_setaffinity')):
+        node_cpus = get_numa_node_cpus()
+    nodes = sorted(node_cpus)
+    
+    writer_nodes = None
+    if config.writer_affinity == 'numa' and nodes:
+        device_node = get_device_numa_node(config.output_path)
+        if device_node in node_cpus:
+            print(f"\nOutput device is attached to NUMA node {device_node}: pinning writers there")
+            writer_nodes = [device_node] * config.num_writers
+        else:
+            print(f"\nWarning: NUMA node of the output device is unknown; "
+                  f"spreading writers across nodes")
+    if writer_nodes is None and len(nodes) > 1 and config.num_writers > 1:
+        writer_nodes = [nodes[i % len(nodes)] for i in range(config.num_writers)]
+    use_node_pools = writer_nodes is not None
     
     # Initialize queues
-    empty_buffers = queue.Queue()
-    full_buffers_list = [queue.Queue() for _ in range(config.num_writers)]
+    # Empty pool is LIFO: the buffer a writer just released is handed to the
+    # producer next, while its pages are still hot in cache/TLB. A FIFO would
+    # recycle it last, after the whole (multi-GB) pool has cycled through.
+    full_buffers_list = [BufferRing() for _ in range(config.num_writers)]
+    
+    if use_node_pools:
+        active_nodes = sorted(set(writer_nodes))
+        node_rings = {node: BufferRing(lifo=True) for node in active_nodes}
+        
+        # Create buffer pools, sized by each node's share of the writers
+        print(f"\nAllocating {config.buffer_count} aligned buffers on "
+              f"NUMA node(s) {', '.join(map(str, active_nodes))}...")
+        remaining = config.buffer_count
+        for index, node in enumerate(active_nodes):
+            if index == len(active_nodes) - 1:
+                count = remaining
+            else:
+                count = config.buffer_count * writer_nodes.count(node) // config.num_writers
+            remaining -= count
+            pool = allocate_numa_local_pool(config.buffer_size, count, node_cpus[node],
+                                            config.huge_pages, config.alignment)
+            print(f"  Node {node}: {count} buffers, writers "
+                  f"{[i for i, n in enumerate(writer_nodes) if n == node]}")
+            node_rings[node].put_many(pool)
+        
+        empty_rings = [node_rings[node] for node in writer_nodes]
+        writer_cpus = [node_cpus[node] for node in writer_nodes]
+        
+        # Give each producer one node's writers, so a producer only cycles
+        # that node's buffers. Needs a producer per node, or some nodes'
+        # writers would sit idle.
+        producer_writers = [list(range(config.num_writers))] * config.num_producers
+        if len(active_nodes) > 1 and config.num_producers >= len(active_nodes):
+            writers_by_node = {node: [i for i, n in enumerate(writer_nodes) if n == node]
+                               for node in active_nodes}
+            producer_writers = [writers_by_node[active_nodes[i % len(active_nodes)]]
+                                for i in range(config.num_producers)]
+            print(f"  Producers feed writers on their own node: "
+                  f"{', '.join(f'P{i}->{w}' for i, w in enumerate(producer_writers))}")
+    else:
+        # Create buffer pool
+        print(f"\nAllocating {config.buffer_count} aligned buffers...")
+        pool = create_aligned_buffer_pool(config.buffer_size, config.buffer_count,
+                                          config.huge_pages, config.alignment)
+        
+        # Fill empty queue with all buffers
+        empty_buffers = BufferRing(lifo=True)
+        empty_buffers.put_many(pool)
+        
+        empty_rings = [empty_buffers] * config.num_writers
+        writer_cpus = [None] * config.num_writers
+        producer_writers = [list(range(config.num_writers))] * config.num_producers
     
-    # Fill empty queue with all buffers
-    for buf in pool:
-        empty_buffers.put(buf)
+    # Shared file offset counter: producers claim stripes of MAX_WRITE_BATCH
+    # buffers in order
+    offsets = itertools.count(0, config.buffer_size * MAX_WRITE_BATCH)
     
     # Initialize stats
     stats = BenchmarkStats(
         start_time=time.perf_counter(),
         end_time=0.0,
         bytes_generated=0,
-        bytes_written=0
+        bytes_written=0,
+        num_producers=config.num_producers,
+        written_progress=ProgressCounters(config.num_writers),
+        writer_stats=[None] * config.num_writers
     )
     
     # Error coordination between threads
     error_event = threading.Event()
+    done_event = threading.Event()
     
-    # Shared lock for stats updates
+    # Shared lock for producer stats updates
     stats_lock = threading.Lock()
     
+    # Resolve the I/O mode once, before any writer starts
+    print(f"\nOpening file: {config.output_path}")
+    open_flags = open_output_flags(config)
+    stats.used_direct_io = bool(open_flags & getattr(os, 'O_DIRECT', 0))
+    
     # Start threads
     print("Starting producer and writer threads...\n")
     
-    producer = threading.Thread(
-        target=producer_thread,
-        args=(config, empty_buffers, full_buffers_list, stats, error_event),
-        name="Producer"
-    )
+    # Create producer threads (each with its own Generator)
+    producers = []
+    for i in range(config.num_producers):
+        producer = threading.Thread(
+            target=producer_thread,
+            args=(i, config, empty_rings, full_buffers_list, producer_writers[i], offsets,
+                  stats, stats_lock, error_event),
+            name=f"Producer-{i}"
+        )
+        producers.append(producer)
     
     # Create multiple writer threads
     consumers = []
     for i in range(config.num_writers):
         consumer = threading.Thread(
             target=consumer_thread,
-            args=(i, config, empty_buffers, full_buffers_list[i], stats, stats_lock, error_event),
+            args=(i, config, empty_rings, full_buffers_list[i], writer_cpus[i], open_flags,
+                  stats, error_event),
             name=f"Writer-{i}"
         )
         consumers.append(consumer)
     
-    producer.start()
+    reporter = threading.Thread(
+        target=reporter_thread,
+        args=(config, stats, done_event, error_event),
+        name="Reporter",
+        daemon=True
+    )
+    
+    for producer in producers:
+        producer.start()
     for consumer in consumers:
         consumer.start()
+    reporter.start()
+    
+    # Wait for all producers, then signal all consumers that we're done
+    for producer in producers:
+        producer.join()
+    for full_buffers in full_buffers_list:
+        full_buffers.put(None)
     
-    # Wait for completion
-    producer.join()
     for consumer in consumers:
         consumer.join()
+    stats.merge_writer_stats()
+    
+    # Holes at the end of the file were never written - set the final size
+    if config.sparse and not error_event.is_set():
+        os.truncate(config.output_path, config.total_size)
+    
+    # One flush for the whole file (O_DIRECT writes bypass the page cache -
+    # nothing to flush). Counted in the total time so buffered runs report
+    # data on disk, not in the page cache.
+    if not stats.used_direct_io and not error_event.is_set():
+        fd = os.open(config.output_path, os.O_WRONLY)
+        try:
+            flush_file_data(fd)
+        finally:
+            os.close(fd)
     
     stats.end_time = time.perf_counter()
     
+    done_event.set()
+    reporter.join()
+    
     # Print results
     print("\n" + "=" * 70)
     print("RESULTS")
@@ -579,6 +1666,10 @@ def run_benchmark(config: BenchmarkConfig) -> BenchmarkStats:
     print(f"\nData Transfer:")
     print(f"  Generated:       {stats.bytes_generated / 1e9:.2f} GB")
     print(f"  Written:         {stats.bytes_written / 1e9:.2f} GB")
+    if config.sparse:
+        print(f"  Sparse (holes):  {stats.sparse_bytes / 1e9:.2f} GB not sent to storage")
+    if config.dedup_copy:
+        print(f"  Dedup copies:    {stats.copied_bytes / 1e9:.2f} GB via copy_file_range")
     print(f"  Total time:      {stats.total_time:.2f} s")
     
     print(f"\nThroughput Breakdown:")
@@ -596,8 +1687,9 @@ def run_benchmark(config: BenchmarkConfig) -> BenchmarkStats:
     # Show per-writer stats if multiple writers
     if config.num_writers > 1 and stats.writer_stats:
         print(f"\nPer-Writer Statistics:")
-        for writer_id in sorted(stats.writer_stats.keys()):
-            wstats = stats.writer_stats[writer_id]
+        for writer_id, wstats in enumerate(stats.writer_stats):
+            if wstats is None:
+                continue
             print(f"  Writer-{writer_id}: {wstats['bytes'] / 1e9:.2f} GB ({wstats['writes']} writes, "
                   f"wait: {wstats['wait_time']:.2f}s)")
     
@@ -628,27 +1720,31 @@ def run_benchmark(config: BenchmarkConfig) -> BenchmarkStats:
 # Command Line Interface
 # ===========================================================================
 
+# Size strings: number + optional unit, e.g. "10GB", "4 MiB", "2G", "512b", "4096"
+_SIZE_RE = re.compile(r'([\d.]+)\s*(?:([KMGT])(?:i?B)?|B)?', re.IGNORECASE)
+
+_SIZE_MULTIPLIERS = {
+    None: 1,
+    'K': 1024,
+    'M': 1024**2,
+    'G': 1024**3,
+    'T': 1024**4,
+}
+
+
 def parse_size(size_str: str) -> int:
-    """Parse size string like '10GB', '500MB', '1TB'"""
-    size_str = size_str.upper().strip()
-    
-    multipliers = {
-        'KB': 1024,
-        'MB': 1024**2,
-        'GB': 1024**3,
-        'TB': 1024**4,
-    }
-    
-    for suffix, multiplier in multipliers.items():
-        if size_str.endswith(suffix):
-            num = float(size_str[:-len(suffix)])
-            return int(num * multiplier)
-    
-    # Try as raw number
+    """Parse size string like '10GB', '500MB', '4MiB', '1T' (binary units)"""
+    match = _SIZE_RE.fullmatch(size_str.strip())
+    if match is None:
+        raise ValueError(f"Invalid size: {size_str}. Use format like '10GB', '500MB', etc.")
+    
+    number, unit = match.groups()
     try:
-        return int(size_str)
+        value = float(number)
     except ValueError:
         raise ValueError(f"Invalid size: {size_str}. Use format like '10GB', '500MB', etc.")
+    
+    return int(value * _SIZE_MULTIPLIERS[unit and unit.upper()])
 
 
 def main():
@@ -695,7 +1791,9 @@ Examples:
         '--buffer-size',
         type=parse_size,
         default=None,
-        help='Size of each buffer (e.g., 4MB, 8MB). Default: auto-tuned or 4MB'
+        help='Size of each buffer (e.g., 4MB, 8MB). With O_DIRECT it is rounded up to a '
+             'multiple of the output device\'s logical block size (and page size). '
+             'Default: auto-tuned or 4MB'
     )
     
     parser.add_argument(
@@ -712,6 +1810,14 @@ Examples:
         help='Number of parallel writer threads (1-64). Default: auto-tuned or 1'
     )
     
+    parser.add_argument(
+        '--num-producers',
+        type=int,
+        default=1,
+        help='Number of parallel producer (generation) threads, each with its own '
+             'Generator. Default: 1'
+    )
+    
     parser.add_argument(
         '--dedup-ratio',
         type=float,
@@ -732,6 +1838,45 @@ Examples:
         help='Disable O_DIRECT (use buffered I/O)'
     )
     
+    parser.add_argument(
+        '--sparse',
+        action='store_true',
+        help='Skip writing all-zero 64 KB ranges (the compressible part of each block '
+             'with --compress-ratio > 1), leaving holes in the output file. Holes count as '
+             'written. Requires sparse file support (ext4, xfs, btrfs); sync engine only'
+    )
+    
+    parser.add_argument(
+        '--dedup-copy',
+        action='store_true',
+        help='With --dedup-ratio N, generate only the first buffer of every N in a '
+             'stripe and create the rest with copy_file_range() (reflinks on btrfs/XFS). '
+             'Duplicates count as written. N is capped at 8 buffers; sync engine only'
+    )
+    
+    parser.add_argument(
+        '--huge-pages',
+        action='store_true',
+        help='Back the buffer pool with explicit 2 MB hugetlb pages (memfd_create). '
+             'The pool (buffer-size x buffer-count, rounded up to 2 MB) must fit in '
+             'the hugepage reservation (vm.nr_hugepages); otherwise falls back to THP'
+    )
+    
+    parser.add_argument(
+        '--io-engine',
+        choices=['sync', 'uring'],
+        default='sync',
+        help='Writer I/O engine: sync (pwrite/pwritev) or uring (io_uring, '
+             'requires the liburing package). Default: sync'
+    )
+    
+    parser.add_argument(
+        '--queue-depth',
+        type=int,
+        default=32,
+        help='io_uring writes in flight per writer (--io-engine uring). Default: 32'
+    )
+    
     parser.add_argument(
         '--numa-mode',
         choices=['auto', 'force', 'disabled'],
@@ -739,6 +1884,15 @@ Examples:
         help='NUMA optimization mode. Default: auto'
     )
     
+    parser.add_argument(
+        '--writer-affinity',
+        choices=['auto', 'numa', 'none'],
+        default='auto',
+        help='Writer thread placement: auto (spread writers and their buffer pools across '
+             'NUMA nodes), numa (pin all writers to the NUMA node of the output device), '
+             'none (no pinning). Default: auto'
+    )
+    
     parser.add_argument(
         '--max-threads',
         type=int,
@@ -773,13 +1927,46 @@ Examples:
             print()
     
     # Validate
-    if args.buffer_size % 4096 != 0:
-        print(f"Warning: Buffer size should be multiple of 4096 for optimal O_DIRECT performance")
+    # O_DIRECT alignment: the device's logical block size, at least one page
+    block_size = get_device_block_size(args.output)
+    alignment = max(block_size or PAGE_SIZE, PAGE_SIZE)
+    if args.buffer_size % alignment != 0:
+        if args.no_direct:
+            print(f"Warning: Buffer size should be multiple of {alignment} for optimal performance")
+        else:
+            aligned_size = (args.buffer_size + alignment - 1) // alignment * alignment
+            print(f"Warning: Buffer size {args.buffer_size} is not a multiple of the O_DIRECT "
+                  f"alignment ({alignment}); rounding up to {aligned_size}")
+            args.buffer_size = aligned_size
     
     if args.num_writers < 1 or args.num_writers > 64:
         print(f"Error: --num-writers must be between 1 and 64")
         return 1
     
+    if args.num_producers < 1 or args.num_producers > 64:
+        print(f"Error: --num-producers must be between 1 and 64")
+        return 1
+    
+    if args.io_engine == 'uring' and liburing is None:
+        print(f"Warning: --io-engine uring requires liburing (pip install liburing)")
+        print(f"         Falling back to --io-engine sync")
+        args.io_engine = 'sync'
+    
+    if args.sparse and args.io_engine == 'uring':
+        print(f"Warning: --sparse is not supported with --io-engine uring; ignoring --sparse")
+        args.sparse = False
+    
+    if args.dedup_copy and args.io_engine == 'uring':
+        print(f"Warning: --dedup-copy is not supported with --io-engine uring; ignoring --dedup-copy")
+        args.dedup_copy = False
+    
+    if args.dedup_copy and args.dedup_ratio < 2:
+        print(f"Warning: --dedup-copy has no effect without --dedup-ratio 2 or higher")
+    
+    if args.queue_depth < 1:
+        print(f"Error: --queue-depth must be at least 1")
+        return 1
+    
     if args.num_writers > args.buffer_count:
         print(f"Warning: --num-writers ({args.num_writers}) > --buffer-count ({args.buffer_count})")
         print(f"         Writers may starve waiting for buffers. Consider increasing buffer count.")
@@ -795,7 +1982,15 @@ Examples:
         use_direct_io=not args.no_direct,
         numa_mode=args.numa_mode,
         max_threads=args.max_threads,
-        num_writers=args.num_writers
+        num_writers=args.num_writers,
+        num_producers=args.num_producers,
+        io_engine=args.io_engine,
+        queue_depth=args.queue_depth,
+        huge_pages=args.huge_pages,
+        writer_affinity=args.writer_affinity,
+        alignment=alignment,
+        sparse=args.sparse,
+        dedup_copy=args.dedup_copy
     )
     
     # Run benchmark
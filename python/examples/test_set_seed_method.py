@@ -9,11 +9,58 @@ This script validates:
 """
 
 import dgen_py
+import contextlib
 import hashlib
+import io
+import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 
-def hash_buffer(buf):
-    """Calculate SHA256 hash of buffer for comparison"""
-    return hashlib.sha256(bytes(buf)).hexdigest()
+try:
+    # xxHash3-128 (pip install xxhash): non-cryptographic, tens of GB/s per core.
+    # 128 bits is ample for telling apart the handful of buffers compared here.
+    import xxhash
+except ImportError:
+    xxhash = None
+
+def new_hasher(data=b""):
+    """Hasher for test fingerprints: xxHash3-128 if installed, else SHA256"""
+    if xxhash:
+        return xxhash.xxh3_128(data)
+    return hashlib.sha256(data)
+
+def hash_buffer(buf, nbytes=None):
+    """Calculate hash of buffer (or its first nbytes) for comparison, without copying it"""
+    view = memoryview(buf)
+    return new_hasher(view[:nbytes] if nbytes is not None else view).hexdigest()
+
+FINGERPRINT_BYTES = 4096  # Plenty to tell differently seeded streams apart
+
+def fingerprint(buf):
+    """Printable fingerprint of the start of a buffer"""
+    return hash_buffer(buf, FINGERPRINT_BYTES)
+
+def eq_buf(a, na, b, nb):
+    """Whether a[:na] equals b[:nb], via memcmp and without copying (a is a bytearray)"""
+    # Note: memoryview == memoryview compares item by item, far slower than this
+    return na == nb and a.startswith(memoryview(b)[:nb])
+
+GENERATOR_SIZE = 40 * 1024 * 1024  # Longest stream any test generates
+_generator = None
+
+def get_generator(seed):
+    """
+    Shared Generator, rewound to the start of a stream with `seed`.
+    
+    Each Generator builds its own Rayon thread pool; rewinding one with
+    reset() + set_seed() starts an identical stream without building another.
+    """
+    global _generator
+    if _generator is None:
+        _generator = dgen_py.Generator(size=GENERATOR_SIZE, seed=seed)
+    else:
+        _generator.reset()
+        _generator.set_seed(seed)
+    return _generator
 
 def test_seed_change_produces_different_data():
     """Test that changing seed mid-stream changes data pattern"""
@@ -21,40 +68,38 @@ def test_seed_change_produces_different_data():
     print("TEST 1: Changing seed mid-stream produces different data")
     print("=" * 80)
     
-    size = 20 * 1024 * 1024  # 20 MB
     chunk_size = 10 * 1024 * 1024  # 10 MB chunks
     
-    # First generator with seed changes
-    gen1 = dgen_py.Generator(size=size, seed=11111)
+    # First stream with seed changes
+    gen1 = get_generator(11111)
     buffer1a = bytearray(chunk_size)
     nbytes1a = gen1.fill_chunk(buffer1a)
-    hash1a = hash_buffer(buffer1a[:nbytes1a])
     
     gen1.set_seed(22222)  # Change seed mid-stream
     buffer1b = bytearray(chunk_size)
     nbytes1b = gen1.fill_chunk(buffer1b)
-    hash1b = hash_buffer(buffer1b[:nbytes1b])
     
-    # Second generator staying with first seed
-    gen2 = dgen_py.Generator(size=size, seed=11111)
+    # Second stream staying with first seed (same generator, rewound)
+    gen2 = get_generator(11111)
     buffer2a = bytearray(chunk_size)
     nbytes2a = gen2.fill_chunk(buffer2a)
-    hash2a = hash_buffer(buffer2a[:nbytes2a])
     
     buffer2b = bytearray(chunk_size)
     nbytes2b = gen2.fill_chunk(buffer2b)  # Still using seed=11111
-    hash2b = hash_buffer(buffer2b[:nbytes2b])
     
-    print(f"Gen1 chunk 1 (seed=11111): {hash1a}")
-    print(f"Gen2 chunk 1 (seed=11111): {hash2a}")
-    print(f"First chunks match: {hash1a == hash2a}")
+    first_match = eq_buf(buffer1a, nbytes1a, buffer2a, nbytes2a)
+    second_match = eq_buf(buffer1b, nbytes1b, buffer2b, nbytes2b)
+    
+    print(f"Gen1 chunk 1 (seed=11111): {fingerprint(buffer1a)}")
+    print(f"Gen2 chunk 1 (seed=11111): {fingerprint(buffer2a)}")
+    print(f"First chunks match: {first_match}")
     print()
-    print(f"Gen1 chunk 2 (seed=22222): {hash1b}")
-    print(f"Gen2 chunk 2 (seed=11111): {hash2b}")
-    print(f"Second chunks differ: {hash1b != hash2b}")
+    print(f"Gen1 chunk 2 (seed=22222): {fingerprint(buffer1b)}")
+    print(f"Gen2 chunk 2 (seed=11111): {fingerprint(buffer2b)}")
+    print(f"Second chunks differ: {not second_match}")
     print()
     
-    passed = (hash1a == hash2a) and (hash1b != hash2b)
+    passed = first_match and not second_match
     print(f"{'✅ PASS' if passed else '❌ FAIL'}: Seed change produces different data\n")
     return passed
 
@@ -64,57 +109,60 @@ def test_same_seed_sequence_reproducible():
     print("TEST 2: Same seed sequence produces identical data")
     print("=" * 80)
     
-    size = 30 * 1024 * 1024  # 30 MB
     chunk_size = 10 * 1024 * 1024  # 10 MB chunks
-    
-    # First run with seed sequence: 111 -> 222 -> 333
-    gen1 = dgen_py.Generator(size=size, seed=111)
-    
-    buffer1a = bytearray(chunk_size)
-    gen1.fill_chunk(buffer1a)
-    hash1a = hash_buffer(buffer1a)
-    
-    gen1.set_seed(222)
-    buffer1b = bytearray(chunk_size)
-    gen1.fill_chunk(buffer1b)
-    hash1b = hash_buffer(buffer1b)
-    
-    gen1.set_seed(333)
-    buffer1c = bytearray(chunk_size)
-    gen1.fill_chunk(buffer1c)
-    hash1c = hash_buffer(buffer1c)
-    
-    # Second run with same seed sequence
-    gen2 = dgen_py.Generator(size=size, seed=111)
-    
-    buffer2a = bytearray(chunk_size)
-    gen2.fill_chunk(buffer2a)
-    hash2a = hash_buffer(buffer2a)
-    
-    gen2.set_seed(222)
-    buffer2b = bytearray(chunk_size)
-    gen2.fill_chunk(buffer2b)
-    hash2b = hash_buffer(buffer2b)
-    
-    gen2.set_seed(333)
-    buffer2c = bytearray(chunk_size)
-    gen2.fill_chunk(buffer2c)
-    hash2c = hash_buffer(buffer2c)
-    
-    print(f"Run 1 - Chunk 1 (seed=111): {hash1a}")
-    print(f"Run 2 - Chunk 1 (seed=111): {hash2a}")
-    print(f"Chunk 1 matches: {hash1a == hash2a}")
-    print()
-    print(f"Run 1 - Chunk 2 (seed=222): {hash1b}")
-    print(f"Run 2 - Chunk 2 (seed=222): {hash2b}")
-    print(f"Chunk 2 matches: {hash1b == hash2b}")
-    print()
-    print(f"Run 1 - Chunk 3 (seed=333): {hash1c}")
-    print(f"Run 2 - Chunk 3 (seed=333): {hash2c}")
-    print(f"Chunk 3 matches: {hash1c == hash2c}")
+    seeds = [111, 222, 333]
+    
+    # Two runs with the same seed sequence: 111 -> 222 -> 333, one after the
+    # other on the shared generator. Run 1's chunks are kept for comparison;
+    # run 2 generates into one of two buffers while the previous chunk is
+    # still being digested from the other.
+    buffers1 = [bytearray(chunk_size) for _ in seeds]
+    buffers2 = [bytearray(chunk_size), bytearray(chunk_size)]
+    sizes1 = []
+    
+    # One digest per run over the whole stream, fed chunk by chunk
+    stream1 = new_hasher()
+    stream2 = new_hasher()
+    
+    passed = True
+    with ThreadPoolExecutor(max_workers=1) as digester:
+        gen = get_generator(seeds[0])
+        for chunk, seed in enumerate(seeds, 1):
+            buffer1 = buffers1[chunk - 1]
+            if chunk > 1:
+                gen.set_seed(seed)
+            nbytes1 = gen.fill_chunk(buffer1)  # Overlaps digesting the previous chunk
+            sizes1.append(nbytes1)
+            digester.submit(stream1.update, memoryview(buffer1)[:nbytes1])
+        
+        gen = get_generator(seeds[0])  # Rewind for run 2
+        pending = None
+        for chunk, seed in enumerate(seeds, 1):
+            buffer1 = buffers1[chunk - 1]
+            buffer2 = buffers2[chunk % 2]
+            if chunk > 1:
+                gen.set_seed(seed)
+            nbytes2 = gen.fill_chunk(buffer2)  # Overlaps digesting the previous chunk
+            match = eq_buf(buffer1, sizes1[chunk - 1], buffer2, nbytes2)
+            
+            if pending:
+                pending.result()  # Other buffer is free for the next fill
+            pending = digester.submit(stream2.update, memoryview(buffer2)[:nbytes2])
+            
+            print(f"Run 1 - Chunk {chunk} (seed={seed}): {fingerprint(buffer1)}")
+            print(f"Run 2 - Chunk {chunk} (seed={seed}): {fingerprint(buffer2)}")
+            print(f"Chunk {chunk} matches: {match}")
+            print()
+            passed = passed and match
+        pending.result()
+    
+    stream_match = stream1.hexdigest() == stream2.hexdigest()
+    print(f"Run 1 - Stream (111 -> 222 -> 333): {stream1.hexdigest()}")
+    print(f"Run 2 - Stream (111 -> 222 -> 333): {stream2.hexdigest()}")
+    print(f"Streams match: {stream_match}")
     print()
     
-    passed = (hash1a == hash2a) and (hash1b == hash2b) and (hash1c == hash2c)
+    passed = passed and stream_match
     print(f"{'✅ PASS' if passed else '❌ FAIL'}: Same seed sequence is reproducible\n")
     return passed
 
@@ -124,41 +172,39 @@ def test_switch_to_nondeterministic():
     print("TEST 3: Switching to non-deterministic mode")
     print("=" * 80)
     
-    size = 20 * 1024 * 1024  # 20 MB
     chunk_size = 10 * 1024 * 1024  # 10 MB chunks
     
-    # First generator: deterministic then non-deterministic
-    gen1 = dgen_py.Generator(size=size, seed=12345)
+    # First stream: deterministic then non-deterministic
+    gen1 = get_generator(12345)
     buffer1a = bytearray(chunk_size)
-    gen1.fill_chunk(buffer1a)
-    hash1a = hash_buffer(buffer1a)
+    nbytes1a = gen1.fill_chunk(buffer1a)
     
     gen1.set_seed(None)  # Switch to non-deterministic
     buffer1b = bytearray(chunk_size)
-    gen1.fill_chunk(buffer1b)
-    hash1b = hash_buffer(buffer1b)
+    nbytes1b = gen1.fill_chunk(buffer1b)
     
-    # Second generator: same sequence
-    gen2 = dgen_py.Generator(size=size, seed=12345)
+    # Second stream: same sequence (same generator, rewound)
+    gen2 = get_generator(12345)
     buffer2a = bytearray(chunk_size)
-    gen2.fill_chunk(buffer2a)
-    hash2a = hash_buffer(buffer2a)
+    nbytes2a = gen2.fill_chunk(buffer2a)
     
     gen2.set_seed(None)  # Switch to non-deterministic
     buffer2b = bytearray(chunk_size)
-    gen2.fill_chunk(buffer2b)
-    hash2b = hash_buffer(buffer2b)
+    nbytes2b = gen2.fill_chunk(buffer2b)
+    
+    first_match = eq_buf(buffer1a, nbytes1a, buffer2a, nbytes2a)
+    second_match = eq_buf(buffer1b, nbytes1b, buffer2b, nbytes2b)
     
-    print(f"Gen1 chunk 1 (seed=12345): {hash1a}")
-    print(f"Gen2 chunk 1 (seed=12345): {hash2a}")
-    print(f"Deterministic chunks match: {hash1a == hash2a}")
+    print(f"Gen1 chunk 1 (seed=12345): {fingerprint(buffer1a)}")
+    print(f"Gen2 chunk 1 (seed=12345): {fingerprint(buffer2a)}")
+    print(f"Deterministic chunks match: {first_match}")
     print()
-    print(f"Gen1 chunk 2 (seed=None): {hash1b}")
-    print(f"Gen2 chunk 2 (seed=None): {hash2b}")
-    print(f"Non-deterministic chunks differ: {hash1b != hash2b}")
+    print(f"Gen1 chunk 2 (seed=None): {fingerprint(buffer1b)}")
+    print(f"Gen2 chunk 2 (seed=None): {fingerprint(buffer2b)}")
+    print(f"Non-deterministic chunks differ: {not second_match}")
     print()
     
-    passed = (hash1a == hash2a) and (hash1b != hash2b)
+    passed = first_match and not second_match
     print(f"{'✅ PASS' if passed else '❌ FAIL'}: Non-deterministic mode works correctly\n")
     return passed
 
@@ -168,36 +214,25 @@ def test_create_striped_pattern():
     print("DEMO: Creating reproducible striped pattern (A-B-A-B)")
     print("=" * 80)
     
-    size = 40 * 1024 * 1024  # 40 MB
     chunk_size = 10 * 1024 * 1024  # 10 MB chunks
     
     # Create pattern: A-B-A-B using two alternating seeds
-    gen = dgen_py.Generator(size=size, seed=1111)  # Seed A
-    hashes = []
-    
-    # Stripe 1: A
-    gen.set_seed(1111)
-    buffer = bytearray(chunk_size)
-    gen.fill_chunk(buffer)
-    hashes.append(("A", hash_buffer(buffer)))
-    
-    # Stripe 2: B
-    gen.set_seed(2222)
-    buffer = bytearray(chunk_size)
-    gen.fill_chunk(buffer)
-    hashes.append(("B", hash_buffer(buffer)))
-    
-    # Stripe 3: A (should match Stripe 1)
-    gen.set_seed(1111)
-    buffer = bytearray(chunk_size)
-    gen.fill_chunk(buffer)
-    hashes.append(("A", hash_buffer(buffer)))
-    
-    # Stripe 4: B (should match Stripe 2)
-    gen.set_seed(2222)
-    buffer = bytearray(chunk_size)
-    gen.fill_chunk(buffer)
-    hashes.append(("B", hash_buffer(buffer)))
+    gen = get_generator(1111)  # Seed A
+    # Two buffers: each stripe is generated into one while the previous
+    # stripe is hashed from the other
+    buffers = [bytearray(chunk_size), bytearray(chunk_size)]
+    pending = []
+    
+    with ThreadPoolExecutor(max_workers=1) as hasher:
+        pattern = [("A", 1111), ("B", 2222), ("A", 1111), ("B", 2222)]
+        for i, (seed_name, seed) in enumerate(pattern):
+            buffer = buffers[i % 2]
+            gen.set_seed(seed)
+            gen.fill_chunk(buffer)  # Overlaps hashing the previous stripe
+            if pending:
+                pending[-1][1].result()  # Other buffer is free for the next fill
+            pending.append((seed_name, hasher.submit(hash_buffer, buffer)))
+    hashes = [(seed_name, future.result()) for seed_name, future in pending]
     
     print("Stripe pattern created:")
     for i, (seed_name, hash_val) in enumerate(hashes, 1):
@@ -218,17 +253,35 @@ def test_create_striped_pattern():
     print(f"{'✅ PASS' if passed else '❌ FAIL'}: Striped pattern is reproducible\n")
     return passed
 
+TESTS = [
+    ("Seed change produces different data", test_seed_change_produces_different_data),
+    ("Same seed sequence is reproducible", test_same_seed_sequence_reproducible),
+    ("Non-deterministic mode works", test_switch_to_nondeterministic),
+    ("Striped pattern creation", test_create_striped_pattern),
+]
+
+def _run_one(index):
+    """Run one test in a worker process, capturing its output"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        passed = TESTS[index][1]()
+    return output.getvalue(), passed
+
 if __name__ == "__main__":
     print("\n")
     print("dgen-py set_seed() Method Test Suite")
     print("=" * 80)
     print()
     
+    # The tests share no state: run them in parallel, one process each.
+    # 'spawn' starts clean interpreters (no fork of the Rust thread pool).
+    with mp.get_context("spawn").Pool(len(TESTS)) as pool:
+        outputs = pool.map(_run_one, range(len(TESTS)))
+    
     results = []
-    results.append(("Seed change produces different data", test_seed_change_produces_different_data()))
-    results.append(("Same seed sequence is reproducible", test_same_seed_sequence_reproducible()))
-    results.append(("Non-deterministic mode works", test_switch_to_nondeterministic()))
-    results.append(("Striped pattern creation", test_create_striped_pattern()))
+    for (name, _), (output, passed) in zip(TESTS, outputs):
+        print(output, end="")  # In test order
+        results.append((name, passed))
     
     print("=" * 80)
     print("SUMMARY")
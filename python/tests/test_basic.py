@@ -1,5 +1,7 @@
 """Tests for dgen-py Python bindings"""
 
+import os
+
 import pytest
 import dgen_py
 
@@ -72,6 +74,26 @@ def test_streaming_generator():
     assert total_generated >= total_size
 
 
+def test_streaming_fill_chunks():
+    """Test filling a whole stream with one fill_chunks call"""
+    total_size = 10 * 1024 * 1024  # 10 MiB
+    chunk_size = 1024 * 1024
+    
+    gen = dgen_py.Generator(size=total_size)
+    buf = bytearray(chunk_size)
+    
+    # Bounded by max_chunks
+    assert gen.fill_chunks(buf, max_chunks=2) == 2 * chunk_size
+    assert gen.position() == 2 * chunk_size
+    
+    # Rest of the stream
+    total_generated = 2 * chunk_size + gen.fill_chunks(buf)
+    
+    assert gen.is_complete()
+    assert total_generated == gen.total_size()
+    assert gen.fill_chunks(buf) == 0
+
+
 def test_streaming_get_chunk():
     """Test streaming generator get_chunk method"""
     total_size = 1024 * 1024  # 1 MiB
@@ -79,14 +101,13 @@ def test_streaming_get_chunk():
     
     gen = dgen_py.Generator(size=total_size)
     
-    chunks = []
+    total = 0
     while not gen.is_complete():
         chunk = gen.get_chunk(chunk_size)
         if chunk is None:
             break
-        chunks.append(chunk)
+        total += len(chunk)
     
-    total = sum(len(c) for c in chunks)
     assert total >= total_size
 
 
@@ -140,5 +161,54 @@ def test_system_info():
         assert info['logical_cpus'] >= info['physical_cores']
 
 
+
+requires_write_runs = pytest.mark.skipif(
+    dgen_py.write_runs is None, reason="write_runs is Linux-only"
+)
+
+
+@requires_write_runs
+def test_write_runs(tmp_path):
+    """Test writing runs of file-contiguous buffers and reading them back"""
+    block = 4096
+    data = bytes(dgen_py.generate_data(4 * block))  # BytesView has no slicing
+    first, second, third = data[:block], data[block:2 * block], bytearray(data[2 * block:])
+    
+    fd = os.open(tmp_path / "runs.bin", os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        written = dgen_py.write_runs(fd, [
+            [(first, block, 0), (second, block, block)],
+            # Not contiguous with the first run, and shorter than its buffer
+            [(third, 1000, 4 * block)],
+        ])
+    finally:
+        os.close(fd)
+    
+    assert written == [2 * block, 1000]
+    
+    contents = (tmp_path / "runs.bin").read_bytes()
+    assert len(contents) == 4 * block + 1000
+    assert contents[:2 * block] == first + second
+    assert contents[2 * block:4 * block] == bytes(2 * block)  # Hole between the runs
+    assert contents[4 * block:] == third[:1000]
+
+
+@requires_write_runs
+def test_write_runs_edge_cases(tmp_path):
+    """Test empty runs and nbytes larger than the buffer"""
+    fd = os.open(tmp_path / "runs.bin", os.O_WRONLY | os.O_CREAT, 0o644)
+    try:
+        assert dgen_py.write_runs(fd, []) == []
+        assert dgen_py.write_runs(fd, [[]]) == [0]
+        
+        with pytest.raises(ValueError):
+            dgen_py.write_runs(fd, [[(bytearray(100), 101, 0)]])
+    finally:
+        os.close(fd)
+    
+    # Nothing was written
+    assert (tmp_path / "runs.bin").read_bytes() == b""
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
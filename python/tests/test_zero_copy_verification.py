@@ -12,6 +12,8 @@ Based on the working Benchmark_dgen-py_FIXED.py
 """
 
 import dgen_py
+import os
+import statistics
 import time
 import sys
 
@@ -21,6 +23,14 @@ def print_section(title):
     print(title)
     print("=" * 60)
 
+def empty_buffer(size):
+    """Uninitialized buffer for fill_chunk (a bytearray is zero-filled first, for nothing)"""
+    try:
+        import numpy as np
+    except ImportError:
+        return bytearray(size)
+    return np.empty(size, dtype=np.uint8)
+
 def test_system_info():
     """Test 1: Verify system info API works"""
     print_section("TEST 1: System Information")
@@ -41,16 +51,19 @@ def test_uma_performance(info):
     """Test 2: Verify UMA performance is preserved"""
     print_section("TEST 2: UMA Performance Preservation")
     
-    # Test with 100 GB - SAME AS WORKING BENCHMARK
-    TEST_SIZE = 100 * 1024 * 1024 * 1024  # 100 GB
+    # 10 GB warmup (caches, TLB, clocks), then the median of 10 x 10 GB
+    # windows: steadier than one 100 GB average, same total measured
+    WARMUP_SIZE = 10 * 1024 * 1024 * 1024  # 10 GB, not measured
+    WINDOW_SIZE = 10 * 1024 * 1024 * 1024  # 10 GB per measured window
+    NUM_WINDOWS = 10
     
-    print(f"Generating {TEST_SIZE / (1024**3):.0f} GB with UMA mode...")
+    print(f"Generating {WARMUP_SIZE / (1024**3):.0f} GB warmup + "
+          f"{NUM_WINDOWS} x {WINDOW_SIZE / (1024**3):.0f} GB windows with UMA mode...")
     print("Using streaming Generator API (zero-copy)...")
-    print("(Same test size as Benchmark_dgen-py_FIXED.py)")
     
     # Create generator
     gen = dgen_py.Generator(
-        size=TEST_SIZE,
+        size=WARMUP_SIZE + NUM_WINDOWS * WINDOW_SIZE,
         dedup_ratio=1.0,
         compress_ratio=1.0,
         numa_mode="auto",  # Auto-detect (uses UMA on single-node systems)
@@ -60,23 +73,38 @@ def test_uma_performance(info):
     chunk_size = gen.chunk_size
     print(f"Chunk size: {chunk_size / (1024**2):.0f} MB")
     
-    buffer = bytearray(chunk_size)
-    
-    start = time.perf_counter()
-    bytes_generated = 0
+    # Pin the driver thread to the first allowed CPU so it can't migrate
+    # between sockets. Only after creating the generator: its Rayon workers
+    # inherit the creator's affinity.
+    pinned = hasattr(os, 'sched_setaffinity')
+    if pinned:
+        previous_cpus = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {min(previous_cpus)})
+        print(f"Driver thread pinned to CPU {min(previous_cpus)}")
     
-    while not gen.is_complete():
-        nbytes = gen.fill_chunk(buffer)
-        if nbytes == 0:
-            break
-        bytes_generated += nbytes
-    
-    elapsed = time.perf_counter() - start
-    throughput = (TEST_SIZE / (1024**3)) / elapsed
-    
-    print(f"\n✓ Time: {elapsed:.3f}s")
-    print(f"✓ Throughput: {throughput:.1f} GB/s")
-    print(f"✓ Generated: {bytes_generated:,} bytes")
+    try:
+        buffer = empty_buffer(chunk_size)
+        
+        gen.fill_chunks(buffer, max_chunks=WARMUP_SIZE // chunk_size)
+        
+        throughputs = []
+        bytes_generated = 0
+        for _ in range(NUM_WINDOWS):
+            start = time.perf_counter_ns()
+            nbytes = gen.fill_chunks(buffer, max_chunks=WINDOW_SIZE // chunk_size)
+            elapsed = (time.perf_counter_ns() - start) / 1e9
+            
+            bytes_generated += nbytes
+            throughputs.append((nbytes / (1024**3)) / elapsed)
+    finally:
+        if pinned:
+            os.sched_setaffinity(0, previous_cpus)  # Later tests create generators
+    
+    throughput = statistics.median(throughputs)
+    
+    print(f"\n✓ Throughput: {throughput:.1f} GB/s (median of {NUM_WINDOWS} windows)")
+    print(f"✓ Min / max: {min(throughputs):.1f} / {max(throughputs):.1f} GB/s")
+    print(f"✓ Generated: {bytes_generated:,} bytes (after warmup)")
     
     if info:
         per_core = throughput / info['physical_cores']
@@ -99,31 +127,31 @@ def test_zero_copy():
     TEST_SIZE = 100 * 1024 * 1024  # 100 MB
     
     print("Testing generate_data() API...")
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     data = dgen_py.generate_data(
         size=TEST_SIZE,
         dedup_ratio=1.0,
         compress_ratio=1.0,
         numa_mode="auto"
     )
-    gen_time = time.perf_counter() - start
+    gen_ns = time.perf_counter_ns() - start
     
-    print(f"✓ Generation time: {gen_time*1000:.1f} ms")
+    print(f"✓ Generation time: {gen_ns / 1e6:.1f} ms")
     print(f"✓ Data type: {type(data).__name__}")
     print(f"✓ Data length: {len(data):,} bytes")
     
     # Create memoryview - should be INSTANTANEOUS if zero-copy
     print("\nCreating memoryview (should be <1ms if zero-copy)...")
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     view = memoryview(data)
-    view_time = time.perf_counter() - start
+    view_ns = time.perf_counter_ns() - start
     
-    print(f"✓ Memoryview creation: {view_time*1000:.3f} ms")
+    print(f"✓ Memoryview creation: {view_ns / 1e3:.3f} µs")
     
-    if view_time < 0.001:  # < 1ms
-        print(f"✅ PASS: Memoryview instantaneous ({view_time*1000:.3f} ms) - ZERO-COPY CONFIRMED!")
+    if view_ns < 1_000_000:  # < 1ms
+        print(f"✅ PASS: Memoryview instantaneous ({view_ns / 1e3:.3f} µs) - ZERO-COPY CONFIRMED!")
     else:
-        print(f"⚠ WARNING: Memoryview took {view_time*1000:.1f} ms (may indicate data copy)")
+        print(f"⚠ WARNING: Memoryview took {view_ns / 1e6:.1f} ms (may indicate data copy)")
     
     # Verify data is readable
     print("\nVerifying data access...")
@@ -137,16 +165,16 @@ def test_zero_copy():
     try:
         import numpy as np
         print("\nTesting NumPy integration (should also be zero-copy)...")
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         arr = np.frombuffer(view, dtype=np.uint8)
-        np_time = time.perf_counter() - start
+        np_ns = time.perf_counter_ns() - start
         
-        print(f"✓ NumPy array creation: {np_time*1000:.3f} ms")
+        print(f"✓ NumPy array creation: {np_ns / 1e3:.3f} µs")
         print(f"✓ Array shape: {arr.shape}")
         print(f"✓ Array dtype: {arr.dtype}")
         
-        if np_time < 0.001:
-            print(f"✅ PASS: NumPy zero-copy confirmed ({np_time*1000:.3f} ms)")
+        if np_ns < 1_000_000:  # < 1ms
+            print(f"✅ PASS: NumPy zero-copy confirmed ({np_ns / 1e3:.3f} µs)")
         
     except ImportError:
         print("⚠ NumPy not available (optional)")
@@ -174,7 +202,7 @@ def test_streaming_api():
     print(f"✓ Position: {gen.position():,} bytes")
     print(f"✓ Complete: {gen.is_complete()}")
     
-    buffer = bytearray(gen.chunk_size)
+    buffer = empty_buffer(gen.chunk_size)
     chunks_read = 0
     bytes_read = 0
     
@@ -1,29 +1,63 @@
 #!/usr/bin/env python3
 import dgen_py
+import numpy as np
+import os
 import time
 
 # Test different chunk sizes
-TEST_SIZE = 10 * 1024**3  # 10 GB
+TEST_SIZE = 2 * 1024**3  # 2 GB (throughput settles within a second)
 WARMUP_SIZE = 1 * 1024**3  # 1 GB
+MIN_GAIN = 0.03  # Stop once doubling the chunk size gains less than 3%
 
-for chunk_size_mb in [4, 8, 16, 32, 64, 128]:
-    chunk_size = chunk_size_mb * 1024 * 1024
-    
-    # Warmup
-    gen = dgen_py.Generator(size=WARMUP_SIZE, chunk_size=chunk_size)
-    buf = bytearray(chunk_size)
-    while not gen.is_complete():
-        gen.fill_chunk(buf)
-    
-    # Benchmark
-    gen = dgen_py.Generator(size=TEST_SIZE, chunk_size=chunk_size)
-    buf = bytearray(chunk_size)
+# Keep the driver thread from migrating between sockets mid-sweep: pin it to
+# the first allowed CPU (on node 0 on typical multi-socket layouts)
+ALL_CPUS = os.sched_getaffinity(0) if hasattr(os, 'sched_setaffinity') else None
+DRIVER_CPUS = {min(ALL_CPUS)} if ALL_CPUS else None
+
+def new_generator(**kwargs):
+    """Generator with Rayon workers on all CPUs, driven from DRIVER_CPUS"""
+    # Workers inherit the creating thread's affinity: unpin while creating
+    if DRIVER_CPUS:
+        os.sched_setaffinity(0, ALL_CPUS)
+    gen = dgen_py.Generator(**kwargs)
+    if DRIVER_CPUS:
+        os.sched_setaffinity(0, DRIVER_CPUS)
+    return gen
+
+def measure(chunk_size, buf):
+    """Generate TEST_SIZE in chunk_size chunks; returns (seconds, GB/s)"""
+    gen = new_generator(size=TEST_SIZE, chunk_size=chunk_size)
     
-    start = time.perf_counter()
-    while not gen.is_complete():
-        gen.fill_chunk(buf)
-    end = time.perf_counter()
+    start = time.perf_counter_ns()
+    gen.fill_chunks(buf)  # Whole fill loop in Rust: no per-chunk Python overhead
+    end = time.perf_counter_ns()
     
-    duration = end - start
-    throughput = (TEST_SIZE / 1024**3) / duration
+    duration = (end - start) / 1e9
+    return duration, (TEST_SIZE / 1024**3) / duration
+
+sizes_mb = [4, 8, 16, 32, 64, 128]
+
+if DRIVER_CPUS:
+    print(f"Driver thread pinned to CPU(s) {sorted(DRIVER_CPUS)}")
+
+# One allocation for every size, each using a view of its first chunk_size
+# bytes. np.empty skips the zero-fill a bytearray does (fill_chunk overwrites
+# every byte anyway), and pages a short sweep never reaches are never touched.
+pool = np.empty(sizes_mb[-1] * 1024 * 1024, dtype=np.uint8)
+
+# Warmup (once, at the smallest chunk size)
+buf = pool[:sizes_mb[0] * 1024 * 1024]
+gen = new_generator(size=WARMUP_SIZE, chunk_size=len(buf))
+gen.fill_chunks(buf)
+
+# Double the chunk size until throughput plateaus
+prev_throughput = None
+for chunk_size_mb in sizes_mb:
+    chunk_size = chunk_size_mb * 1024 * 1024
+    duration, throughput = measure(chunk_size, pool[:chunk_size])
     print(f"{chunk_size_mb:3d} MB chunks: {duration:.4f} seconds | {throughput:.2f} GB/s")
+    
+    if prev_throughput and (throughput - prev_throughput) / prev_throughput < MIN_GAIN:
+        print(f"Plateau reached: < {MIN_GAIN:.0%} gain over {chunk_size_mb // 2} MB chunks")
+        break
+    prev_throughput = throughput